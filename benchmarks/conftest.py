@@ -0,0 +1,53 @@
+import pathlib
+
+import pytest
+import yaml
+from netlogo_link import NetLogoLinkStandIn
+
+from heat import BmiHeatDiffusion
+from heat.pool import workspace_pool
+
+ROOT = pathlib.Path(__file__).parent.parent
+CONFIG_FILE = ROOT / "tests" / "data" / "config.yaml"
+NUMPY_CONFIG_FILE = ROOT / "tests" / "data" / "numpy.yaml"
+
+
+@pytest.fixture
+def netlogo_link(monkeypatch):
+    """Replace NetLogoLink with the in-process stand-in."""
+    monkeypatch.setattr("pynetlogo.NetLogoLink", NetLogoLinkStandIn)
+    workspace_pool.clear()
+    yield NetLogoLinkStandIn
+    workspace_pool.clear()
+
+
+@pytest.fixture
+def world(netlogo_link, request, tmp_path):
+    """A configuration file for a world of a max-pxcor and max-pycor parameter."""
+    with open(CONFIG_FILE) as fp:
+        config = yaml.safe_load(fp)
+    config["HeatDiffusion"]["max_pxcor"] = request.param
+    config["HeatDiffusion"]["max_pycor"] = request.param
+
+    path = tmp_path / "config.yaml"
+    with open(path, "w") as fp:
+        yaml.safe_dump(config, fp)
+    return path
+
+
+@pytest.fixture
+def model(netlogo_link, world):
+    """A model initialized through the stand-in."""
+    model = BmiHeatDiffusion()
+    model.initialize(world)
+    yield model
+    model.finalize()
+
+
+def count_round_trips(benchmark, model, func, *args):
+    """Record the round trips of one call of *func* in the benchmark's info."""
+    link = model._model._link
+    n_commands, n_reports = link.n_commands, link.n_reports
+    func(*args)
+    benchmark.extra_info["commands"] = link.n_commands - n_commands
+    benchmark.extra_info["reports"] = link.n_reports - n_reports
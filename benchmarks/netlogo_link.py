@@ -0,0 +1,221 @@
+"""A deterministic, in-process stand-in for ``pynetlogo.NetLogoLink``.
+
+The stand-in understands the commands and reporters that
+:class:`heat.netlogo.NetLogoHeatDiffusion` sends, and runs them with the
+NumPy port of the model. It counts round trips, so benchmarks can measure
+the Python side of the NetLogo backend on machines without NetLogo or Java.
+"""
+
+import re
+
+import numpy
+
+from heat.heat import TILE_PARAMETERS, HeatDiffusion
+from heat.metadata import read_interface
+
+LIST = r"(\[[^\[\]]*\])"
+VALUE = r"(\"[^\"]*\"|\S+)"
+
+
+def parse_list(text: str) -> numpy.ndarray:
+    return numpy.array(text[1:-1].split(), dtype=float)
+
+
+def parse_value(text: str):
+    if text.startswith('"'):
+        return text[1:-1]
+    elif text in ("true", "false"):
+        return text == "true"
+    return float(text)
+
+
+class NetLogoLinkStandIn:
+    """Answer NetLogoLink commands and reporters with the NumPy model."""
+
+    def __init__(self, gui=False, thd=False, netlogo_home=None, **kwds):
+        self.model = None
+        self.switches = {}
+        self.steady = (0.0, 0)
+        self.n_commands = 0
+        self.n_reports = 0
+        self._commands = [
+            (r"set (render\?|kernel) " + VALUE, self._set_switch),
+            (r"set ([\w-]+) " + VALUE, self._set_parameter),
+            (r"resize-world (\S+) (\S+) (\S+) (\S+)", self._resize_world),
+            (
+                r"setup-tiles (\d+) (\d+) (\d+) (\[(?:\s*\[[^\[\]]*\])*\s*\])",
+                self._setup_tiles,
+            ),
+            (r"setup", self._setup),
+            (r"repeat (\d+) \[go\]", self._repeat_go),
+            (r"go-fraction (\S+)", self._go_fraction),
+            (r"go-until-steady (\S+) (\S+) (\S+)", self._go_until_steady),
+            (r"reset-ticks", self._reset_ticks),
+            (r"tick-advance (\S+)", self._tick_advance),
+            (
+                (
+                    rf"\(foreach sorted-patches {LIST}"
+                    r" \[\[p t\] -> ask p \[set temperature t\]\]\)"
+                ),
+                self._set_temperature,
+            ),
+            (
+                (
+                    rf"\(foreach sorted-patches {LIST} {LIST}"
+                    r" \[\[p t old\] -> ask p"
+                    r" \[set temperature t set old-temperature old\]\]\)"
+                ),
+                self._set_fields,
+            ),
+            (
+                (
+                    rf"\(foreach {LIST} {LIST} {LIST}"
+                    r" \[\[x y t\] -> ask patch x y \[set temperature t\]\]\)"
+                ),
+                self._set_temperature_at_patches,
+            ),
+        ]
+        self._reporters = [
+            (
+                r"\(list min-pxcor max-pxcor min-pycor max-pycor\)",
+                lambda: numpy.array(self.model.extent, dtype=float),
+            ),
+            (
+                r"map \[p -> \[temperature\] of p\] sorted-patches",
+                lambda: self.model.get_temperature(),
+            ),
+            (
+                r"map \[p -> \[temperature\] of p\] sorted-plate-patches",
+                lambda: self.model.get_plate_temperature(),
+            ),
+            (
+                (
+                    r"\(sentence map \[p -> \[temperature\] of p\] sorted-patches"
+                    r" map \[p -> \[old-temperature\] of p\] sorted-patches\)"
+                ),
+                self._report_fields,
+            ),
+            (r"\(list ticks ([\w\- ]+)\)", self._report_list),
+            (
+                r"\(list residual steady-ticks\)",
+                lambda: numpy.array(self.steady, dtype=float),
+            ),
+            (
+                rf"\(map \[\[x y\] -> \[temperature\] of patch x y\] {LIST} {LIST}\)",
+                self._report_temperature_at_patches,
+            ),
+            (r"diagnostics", lambda: self.model.get_diagnostics()),
+            (r"([\w\-?]+)", self._report_name),
+        ]
+
+    def load_model(self, path):
+        self.model = HeatDiffusion(extent=read_interface(path).extent)
+
+    def kill_workspace(self):
+        self.model = None
+
+    def command(self, netlogo_command):
+        self.n_commands += 1
+        position = 0
+        while position < len(netlogo_command):
+            if netlogo_command[position].isspace():
+                position += 1
+                continue
+            for pattern, run in self._commands:
+                match = re.compile(pattern).match(netlogo_command, position)
+                if match:
+                    run(*match.groups())
+                    position = match.end()
+                    break
+            else:
+                raise ValueError(f"unknown command: {netlogo_command[position:]!r}")
+
+    def report(self, netlogo_reporter):
+        self.n_reports += 1
+        for pattern, run in self._reporters:
+            match = re.fullmatch(pattern, netlogo_reporter)
+            if match:
+                return run(*match.groups())
+        raise ValueError(f"unknown reporter: {netlogo_reporter!r}")
+
+    def _set_switch(self, name, value):
+        self.switches[name] = parse_value(value)
+
+    def _set_parameter(self, name, value):
+        if name == "material-type":
+            self.model.set_parameters(
+                {
+                    "material-type": parse_value(value),
+                    "alpha": self.model.report("alpha"),
+                }
+            )
+        else:
+            self.model.set_parameters({name: parse_value(value)})
+
+    def _resize_world(self, *extent):
+        self.model.resize([int(bound) for bound in extent])
+
+    def _setup(self):
+        self.model.setup()
+
+    def _setup_tiles(self, width, height, n_columns, members):
+        self.model.setup_tiles(
+            (int(height), int(width)),
+            int(n_columns),
+            [
+                dict(zip(TILE_PARAMETERS, parse_list(member)))
+                for member in re.findall(r"\[[^\[\]]*\]", members[1:-1])
+            ],
+        )
+
+    def _repeat_go(self, n_ticks):
+        self.model.go(int(n_ticks))
+
+    def _go_fraction(self, fraction):
+        self.model.go(0, fraction=float(fraction))
+
+    def _go_until_steady(self, n_ticks, interval, tolerance):
+        self.steady = self.model.go_until_steady(
+            int(n_ticks), int(interval), float(tolerance)
+        )
+
+    def _reset_ticks(self):
+        self.model.ticks = 0.0
+
+    def _tick_advance(self, ticks):
+        self.model.ticks += float(ticks)
+
+    def _set_temperature(self, values):
+        self.model.set_temperature(parse_list(values))
+
+    def _set_fields(self, temperature, old_temperature):
+        self.model.set_temperature(parse_list(temperature))
+        self.model.old_temperature.reshape(-1)[:] = parse_list(old_temperature)
+
+    def _set_temperature_at_patches(self, xs, ys, values):
+        self.model.set_temperature_at_indices(self._indices(xs, ys), parse_list(values))
+
+    def _report_fields(self):
+        return numpy.concatenate(
+            [self.model.get_temperature(), self.model.old_temperature.reshape(-1)]
+        )
+
+    def _report_list(self, names):
+        return numpy.array(
+            [self.model.ticks] + [self.model.report(name) for name in names.split()],
+            dtype=float,
+        )
+
+    def _report_temperature_at_patches(self, xs, ys):
+        return self.model.get_temperature_at_indices(self._indices(xs, ys))
+
+    def _report_name(self, name):
+        if name in self.switches:
+            return self.switches[name]
+        return self.model.report(name)
+
+    def _indices(self, xs, ys):
+        min_pxcor, max_pxcor, _, max_pycor = self.model.extent
+        rows = max_pycor - parse_list(ys).astype(int)
+        cols = parse_list(xs).astype(int) - min_pxcor
+        return rows * (max_pxcor - min_pxcor + 1) + cols
@@ -0,0 +1,207 @@
+"""Benchmark the BMI hot paths."""
+
+import contextlib
+import io
+import itertools
+import os
+import runpy
+
+import numpy as np
+import pytest
+import yaml
+from conftest import CONFIG_FILE, NUMPY_CONFIG_FILE, ROOT, count_round_trips
+
+from heat import BmiHeatDiffusion
+from heat.pool import workspace_pool
+
+VAR_NAME = "plate_surface__temperature"
+WORLD_SIZES = [25, 50, 100]
+N_STEPS = [1, 10, 100]
+EDGE_TEMPERATURES = ("top-temp", "bottom-temp", "left-temp", "right-temp")
+
+world_sizes = pytest.mark.parametrize("world", WORLD_SIZES, indirect=True)
+
+
+@world_sizes
+@pytest.mark.parametrize("pooled", [False, True])
+def test_initialize(benchmark, netlogo_link, world, pooled, monkeypatch):
+    monkeypatch.setattr(workspace_pool, "enabled", pooled)
+
+    def initialize_and_finalize():
+        model = BmiHeatDiffusion()
+        model.initialize(world)
+        model.finalize()
+
+    benchmark(initialize_and_finalize)
+
+
+@world_sizes
+def test_update(benchmark, model):
+    count_round_trips(benchmark, model, model.update)
+    benchmark(model.update)
+
+
+@world_sizes
+@pytest.mark.parametrize("n_steps", N_STEPS)
+def test_update_until(benchmark, model, n_steps):
+    def update_until():
+        model.update_until(model.get_current_time() + n_steps * model.get_time_step())
+
+    count_round_trips(benchmark, model, update_until)
+    benchmark(update_until)
+
+
+def test_update_until_steady(benchmark, netlogo_link, tmp_path):
+    with open(CONFIG_FILE) as fp:
+        config = yaml.safe_load(fp)
+    config["HeatDiffusion"]["steady_state"] = {"tolerance": 1e-3, "interval": 10}
+    with open(tmp_path / "steady.yaml", "w") as fp:
+        yaml.safe_dump(config, fp)
+
+    model = BmiHeatDiffusion()
+    model.initialize(tmp_path / "steady.yaml")
+
+    count_round_trips(benchmark, model, model.update_until, 1e4)
+    benchmark.extra_info["ticks"] = round(
+        model.get_current_time() / model.get_time_step()
+    )
+    benchmark.pedantic(model.update_until, args=(1e4,), setup=model.reset, rounds=5)
+    model.finalize()
+
+
+@world_sizes
+def test_get_value(benchmark, model):
+    dest = np.empty(model.get_grid_size(0))
+
+    def update_and_get_value():
+        model.update()
+        model.get_value(VAR_NAME, dest)
+
+    count_round_trips(benchmark, model, update_and_get_value)
+    benchmark(update_and_get_value)
+
+
+@world_sizes
+def test_get_value_cached(benchmark, model):
+    dest = np.empty(model.get_grid_size(0))
+    count_round_trips(benchmark, model, model.get_value, VAR_NAME, dest)
+    benchmark(model.get_value, VAR_NAME, dest)
+
+
+@world_sizes
+def test_get_diagnostics(benchmark, model):
+    names = model.get_output_var_names()[2:]
+    dest = np.empty(1)
+
+    def update_and_get_diagnostics():
+        model.update()
+        for name in names:
+            model.get_value(name, dest)
+
+    count_round_trips(benchmark, model, update_and_get_diagnostics)
+    benchmark(update_and_get_diagnostics)
+
+
+@world_sizes
+def test_get_plate_value(benchmark, model):
+    dest = np.empty(model.get_grid_size(2))
+
+    def update_and_get_plate_value():
+        model.update()
+        model.get_value("plate_region_surface__temperature", dest)
+
+    count_round_trips(benchmark, model, update_and_get_plate_value)
+    benchmark(update_and_get_plate_value)
+
+
+@world_sizes
+def test_set_value(benchmark, model):
+    fields = itertools.cycle(
+        np.random.default_rng(1945).uniform(size=(2, model.get_grid_size(0)))
+    )
+
+    def set_value():
+        model.set_value(VAR_NAME, next(fields))
+
+    count_round_trips(benchmark, model, set_value)
+    benchmark(set_value)
+
+
+@world_sizes
+def test_update_and_set_value_on_a_column(benchmark, model):
+    shape = model.get_grid_shape(0, np.empty(2, dtype=int))
+    field = np.empty(model.get_grid_size(0))
+    temperatures = itertools.cycle(np.random.default_rng(1945).uniform(size=10))
+
+    def update_and_set_value_on_a_column():
+        model.update()
+        model.get_value(VAR_NAME, field)
+        field.reshape(shape)[:, 1] = next(temperatures)
+        model.set_value(VAR_NAME, field)
+
+    count_round_trips(benchmark, model, update_and_set_value_on_a_column)
+    benchmark(update_and_set_value_on_a_column)
+
+
+@world_sizes
+def test_set_value_at_indices(benchmark, model):
+    inds = np.arange(0, model.get_grid_size(0), 97)
+    src = np.full(inds.size, 50.0)
+    count_round_trips(benchmark, model, model.set_value_at_indices, VAR_NAME, inds, src)
+    benchmark(model.set_value_at_indices, VAR_NAME, inds, src)
+
+
+@world_sizes
+def test_set_edge_temperatures_and_update(benchmark, model):
+    temperatures = np.random.default_rng(1945).uniform(0.0, 100.0, size=(1000, 4))
+    steps = iter(temperatures)
+
+    def set_edge_temperatures_and_update():
+        for name, value in zip(EDGE_TEMPERATURES, next(steps)):
+            model.set_value(name, np.array([value]))
+        model.update()
+
+    count_round_trips(benchmark, model, set_edge_temperatures_and_update)
+    benchmark.pedantic(set_edge_temperatures_and_update, rounds=100, iterations=1)
+
+
+@pytest.mark.parametrize("n_members", [1, 9, 36])
+def test_update_tiles(benchmark, netlogo_link, n_members):
+    model = BmiHeatDiffusion()
+    model.initialize(CONFIG_FILE)
+    layout = model.setup_tiles(
+        [{"top-temp": float(member)} for member in range(n_members)]
+    )
+    dest = np.empty((n_members, layout.shape[0] * layout.shape[1]))
+
+    def update_and_get_tile_values():
+        model.update()
+        model.get_tile_values(dest)
+
+    benchmark.extra_info["members"] = n_members
+    count_round_trips(benchmark, model, update_and_get_tile_values)
+    benchmark(update_and_get_tile_values)
+    model.finalize()
+
+
+@pytest.mark.parametrize("n_steps", N_STEPS)
+def test_numpy_backend_update_until(benchmark, n_steps):
+    model = BmiHeatDiffusion()
+    model.initialize(NUMPY_CONFIG_FILE)
+
+    benchmark(
+        lambda: model.update_until(
+            model.get_current_time() + n_steps * model.get_time_step()
+        )
+    )
+    model.finalize()
+
+
+def test_run_bmi_model_example(benchmark, netlogo_link, monkeypatch):
+    monkeypatch.chdir(ROOT / "examples")
+
+    def run_example():
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(os.path.join(ROOT, "examples", "run-bmi-model.py"))
+
+    benchmark(run_example)
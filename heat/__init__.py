@@ -1,6 +1,16 @@
 """Model the diffusion of heat over a 2D plate."""
 
+import importlib
+
 from ._version import __version__
 from .bmi_heatdiffusion import BmiHeatDiffusion
 
-__all__ = ["__version__", "BmiHeatDiffusion"]
+__all__ = ["__version__", "AsyncBmiHeatDiffusion", "BmiHeatDiffusion", "run_ensemble"]
+
+_LAZY = {"AsyncBmiHeatDiffusion": ".aio", "run_ensemble": ".ensemble"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,98 @@
+"""Drive a BmiHeatDiffusion from asyncio, with NetLogo calls on a thread."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+
+from .bmi_heatdiffusion import BmiHeatDiffusion
+
+
+class AsyncBmiHeatDiffusion:
+    """Awaitable stepping and data exchange for a BmiHeatDiffusion.
+
+    Every call that reaches the model runs on one dedicated thread, so the
+    JPype and NetLogo calls of a component always come from the same thread
+    and run in the order they were made, while the event loop is free to
+    run other work, including other components, in the meantime. Each
+    instance gets its own thread unless an *executor* is given; pass one
+    single-threaded executor to several instances to pin them all to the
+    same thread.
+
+    Each method queues its call when it is called, not when it is awaited,
+    and returns a future to await. Values given to ``set_value`` are copied,
+    so the caller can reuse its buffer at once; a ``get_value`` destination
+    must not be read until its future is done.
+
+    The wrapped model is the ``bmi`` attribute. Its grid, variable and time
+    metadata never go to NetLogo and can be read from it directly, but only
+    between awaited calls.
+
+    Parameters
+    ----------
+    executor : ThreadPoolExecutor, optional
+        A single-threaded executor on which to run the model's calls.
+
+    Examples
+    --------
+    >>> import asyncio, numpy
+    >>> from heat.aio import AsyncBmiHeatDiffusion
+    >>> async def run(config_file):
+    ...     model = AsyncBmiHeatDiffusion()
+    ...     await model.initialize(config_file)
+    ...     await model.update_until(1.0)
+    ...     dest = numpy.empty(model.bmi.get_grid_size(0))
+    ...     await model.get_value("plate_surface__temperature", dest)
+    ...     await model.finalize()
+    ...     return dest
+    >>> asyncio.run(run("config.yaml"))  # doctest: +SKIP
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor | None = None):
+        self.bmi = BmiHeatDiffusion()
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def initialize(self, config_file: str) -> asyncio.Future:
+        return self._call(self.bmi.initialize, config_file)
+
+    def update(self) -> asyncio.Future:
+        return self._call(self.bmi.update)
+
+    def update_until(self, time: float) -> asyncio.Future:
+        return self._call(self.bmi.update_until, time)
+
+    def get_value(self, name: str, dest: numpy.ndarray) -> asyncio.Future:
+        return self._call(self.bmi.get_value, name, dest)
+
+    def get_value_at_indices(
+        self, name: str, dest: numpy.ndarray, inds: numpy.ndarray
+    ) -> asyncio.Future:
+        return self._call(self.bmi.get_value_at_indices, name, dest, inds)
+
+    def set_value(self, name: str, src: numpy.ndarray) -> asyncio.Future:
+        return self._call(self.bmi.set_value, name, numpy.array(src))
+
+    def set_value_at_indices(
+        self, name: str, inds: numpy.ndarray, src: numpy.ndarray
+    ) -> asyncio.Future:
+        return self._call(
+            self.bmi.set_value_at_indices, name, numpy.array(inds), numpy.array(src)
+        )
+
+    async def finalize(self) -> None:
+        """Finalize the model and, if this instance started it, stop its thread."""
+        try:
+            await self._call(self.bmi.finalize)
+        finally:
+            if self._owns_executor and self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _call(self, method, *args) -> asyncio.Future:
+        """Queue a method of the model on the model's thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="heat-netlogo"
+            )
+        return asyncio.wrap_future(self._executor.submit(method, *args))
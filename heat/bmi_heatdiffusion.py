@@ -1,14 +1,53 @@
 # -*- coding: utf-8 -*-
+import json
+import math
 import pathlib
 from collections import namedtuple
 
 import numpy
-import pynetlogo
 import yaml
 from bmipy import Bmi
 
+from .heat import (
+    DEFAULT_PARAMETERS,
+    DIAGNOSTICS,
+    HeatDiffusion,
+    check_extent,
+    heat_diffusivity,
+    plate_size,
+    resolve_parameters,
+)
+from .metadata import ModelInterface, read_interface
+from .netlogo import NetLogoHeatDiffusion
+from .pool import workspace_pool
+from .shared import SharedFieldWriter
+from .stats import Instrumentation, InstrumentedLink
+from .stream import OutputStream, SnapshotWriter
+
 HERE = pathlib.Path(__file__)
 MODULE_PATH = HERE.parent
+DEFAULT_MODEL_NAME = "HeatDiffusion.nlogo"
+STEP_TOLERANCE = 1e-9
+SPARSE_FRACTION = 0.25
+WRITE_COUNTS = ("unchanged", "indexed", "full", "patches")
+INPUT_VAR_UNITS = {
+    "alpha": "1",
+    "initial-plate-temp": "C",
+    "top-temp": "C",
+    "bottom-temp": "C",
+    "left-temp": "C",
+    "right-temp": "C",
+}
+PLATE_VAR_NAME = "plate_region_surface__temperature"
+DIAGNOSTIC_VARS = {
+    "plate_surface__mean_of_temperature": ("plate-mean-temp", "C"),
+    "plate_surface__min_of_temperature": ("plate-min-temp", "C"),
+    "plate_surface__max_of_temperature": ("plate-max-temp", "C"),
+    "plate_top_edge__heat_inflow_rate": ("top-heat-inflow", "C s-1"),
+    "plate_bottom_edge__heat_inflow_rate": ("bottom-heat-inflow", "C s-1"),
+    "plate_left_edge__heat_inflow_rate": ("left-heat-inflow", "C s-1"),
+    "plate_right_edge__heat_inflow_rate": ("right-heat-inflow", "C s-1"),
+}
 
 BmiVar = namedtuple(
     "BmiVar", ["dtype", "itemsize", "nbytes", "units", "location", "grid"]
@@ -16,20 +55,44 @@ BmiVar = namedtuple(
 BmiGridUniformRectilinear = namedtuple(
     "BmiGridUniformRectilinear", ["shape", "yx_spacing", "yx_of_lower_left"]
 )
+TileLayout = namedtuple("TileLayout", ["shape", "n_rows", "n_columns", "members"])
 
 
 class BmiHeatDiffusion(Bmi):
     """Solve the heat equation on a 2D plate."""
 
     _name = "The 2D Heat Equation"
-    _input_var_names = ()
-    _output_var_names = ("plate_surface__temperature",)
+    _input_var_names = tuple(INPUT_VAR_UNITS)
+    _output_var_names = (
+        "plate_surface__temperature",
+        PLATE_VAR_NAME,
+    ) + tuple(DIAGNOSTIC_VARS)
 
     def __init__(self):
         self._config = {}
         self._model = None
-        self._var = None
-        self._grid = {}
+        self._pool_key = None
+        self._streams = []
+        self._shared_fields = []
+        self._tiles = None
+        self._stats = None
+        self._stats_file = None
+        self._wrapped_methods = {}
+        self._inputs = {}
+        self._inputs_at_sync = {}
+        self._residual = numpy.nan
+        self._solver = None
+        self._implicit_error = numpy.nan
+        self._diagnostics = {name: numpy.full(1, numpy.nan) for name in DIAGNOSTIC_VARS}
+        self._diagnostics_are_stale = True
+        self._diagnostics_are_shared = False
+        self._plate_value = None
+        self._plate_is_stale = True
+        self._plate_is_shared = False
+        self._value = None
+        self._value_is_stale = True
+        self._value_at_sync = None
+        self._write_counts = dict.fromkeys(WRITE_COUNTS, 0)
         self._time = {
             "current": 0.0,
             "start": 0.0,
@@ -37,10 +100,25 @@ class BmiHeatDiffusion(Bmi):
             "units": "s",
             "step": 0.1,
         }
+        self._describe(self._extent())
+        self._sync_inputs(self._defaults())
 
     def finalize(self) -> None:
-        self._model.kill_workspace()
+        for stream in self._streams:
+            stream.close()
+        self._streams.clear()
+        for field in self._shared_fields:
+            field.close()
+        self._shared_fields.clear()
+        if isinstance(getattr(self._model, "link", None), InstrumentedLink):
+            self._model.link = self._model.link.link
+        if self._pool_key is None:
+            self._model.close()
+        else:
+            workspace_pool.checkin(self._pool_key, self._model)
+            self._pool_key = None
         self._model = None
+        self._stop_instrumentation()
 
     def get_component_name(self) -> str:
         return self._name
@@ -99,6 +177,8 @@ class BmiHeatDiffusion(Bmi):
         return spacing
 
     def get_grid_type(self, grid: int) -> str:
+        if self.get_grid_rank(grid) == 0:
+            return "scalar"
         return "uniform_rectilinear"
 
     def get_grid_x(self, grid: int, x: numpy.ndarray) -> numpy.ndarray:
@@ -132,34 +212,64 @@ class BmiHeatDiffusion(Bmi):
         return self._time["units"]
 
     def get_value(self, name: str, dest: numpy.ndarray) -> numpy.ndarray:
-        dest[:] = self._model.patch_report("temperature").values.base
+        if name in self._inputs:
+            dest[:] = self._inputs[name]
+        elif name in self._diagnostics:
+            dest[:] = self._cached_diagnostics()[name]
+        elif name == PLATE_VAR_NAME:
+            dest[:] = self._cached_plate_value()
+        else:
+            dest[:] = self._cached_value()
         return dest
 
     def get_value_at_indices(
         self, name: str, dest: numpy.ndarray, inds: numpy.ndarray
     ) -> numpy.ndarray:
-        raise NotImplementedError("get_value_at_indices")
+        inds = numpy.asarray(inds, dtype=int)
+        if name in self._inputs:
+            dest[:] = self._inputs[name][inds]
+        elif name in self._diagnostics:
+            dest[:] = self._cached_diagnostics()[name][inds]
+        elif name == PLATE_VAR_NAME:
+            dest[:] = self._cached_plate_value()[inds]
+        elif self._value_is_stale:
+            if inds.size > 0:
+                self._model.get_temperature_at_indices(inds, out=dest)
+        else:
+            dest[:] = self._value[inds]
+        return dest
 
     def get_value_ptr(self, name: str) -> numpy.ndarray:
-        raise NotImplementedError("get_value_ptr")
+        if name in self._inputs:
+            return self._inputs[name]
+        elif name in self._diagnostics:
+            self._diagnostics_are_shared = True
+            return self._cached_diagnostics()[name]
+        elif name == PLATE_VAR_NAME:
+            self._plate_is_shared = True
+            return self._cached_plate_value()
+        value = self._cached_value()
+        if self._value_at_sync is None:
+            self._value_at_sync = value.copy()
+        return value
 
     def get_var_grid(self, name: str) -> int:
-        return self._var.grid
+        return self._var[name].grid
 
     def get_var_itemsize(self, name: str) -> int:
-        return self._var.itemsize
+        return self._var[name].itemsize
 
     def get_var_location(self, name: str) -> str:
-        return self._var.location
+        return self._var[name].location
 
     def get_var_nbytes(self, name: str) -> int:
-        return self._var.nbytes
+        return self._var[name].nbytes
 
     def get_var_type(self, name: str) -> str:
-        return self._var.dtype
+        return self._var[name].dtype
 
     def get_var_units(self, name: str) -> str:
-        return self._var.units
+        return self._var[name].units
 
     def initialize(self, config_file: str) -> None:
         try:
@@ -167,53 +277,784 @@ class BmiHeatDiffusion(Bmi):
                 self._config = yaml.safe_load(fp).get("HeatDiffusion", {})
         except FileNotFoundError:
             raise
+        config_dir = pathlib.Path(config_file).parent
+
+        options = self._config.get("instrumentation", False)
+        self._unwrap_methods()
+        if options:
+            self._start_instrumentation({} if options is True else options, config_dir)
+            with self._stats.measure("initialize"):
+                self._initialize(config_dir)
+        else:
+            self._stats = None
+            self._initialize(config_dir)
+
+    def _initialize(self, config_dir: pathlib.Path) -> None:
+        backend = self._config.get("backend", "netlogo")
+        parameters = self._parameters()
+        extent = self._extent()
+        self._solver = None
+        if "implicit" in self._config:
+            if "steady_state" in self._config:
+                raise ValueError("implicit steps cannot check for a steady state")
+            from .implicit import CrankNicolson
+
+            self._solver = CrankNicolson(
+                round(float(self._config["implicit"]["step"]) / self._time["step"])
+            )
+        if backend == "netlogo":
+            model_path = MODULE_PATH / self._config["model_name"]
+            netlogo_home = self._config["netlogo_home"]
+            if self._config.get("workspace_pool", True):
+                self._pool_key = (netlogo_home, str(model_path))
+                self._model = workspace_pool.checkout(
+                    self._pool_key,
+                    lambda: NetLogoHeatDiffusion(model_path, netlogo_home=netlogo_home),
+                )
+            else:
+                self._model = NetLogoHeatDiffusion(
+                    model_path, netlogo_home=netlogo_home
+                )
+            if self._stats is not None:
+                self._model.link = InstrumentedLink(self._model.link, self._stats)
+            try:
+                self._model.resize(extent)
+                self._model.configure(
+                    render=self._config.get("render", True),
+                    kernel=self._config.get("kernel", "neighbors4"),
+                )
+                self._model.set_parameters(parameters)
+            except BaseException:
+                # no finalize follows a failed initialize, and the workspace
+                # may be half configured, so close it rather than pool it
+                self._model.close()
+                self._model = self._pool_key = None
+                raise
+        elif backend == "numpy":
+            self._model = HeatDiffusion(extent=extent, parameters=parameters)
+        else:
+            raise ValueError(f"{backend}: unknown backend")
+        self._tiles = None
+        self._model.setup()
+        self._residual = numpy.nan
+        self._implicit_error = numpy.nan
+
+        self._describe(extent)
+        self._value = numpy.empty(numpy.prod(self._grid[0].shape), dtype=float)
+        self._model.get_temperature(out=self._value)
+        self._value_is_stale = False
+        self._value_at_sync = None
+        self._write_counts = dict.fromkeys(WRITE_COUNTS, 0)
+        self._diagnostics_are_stale = True
+        self._diagnostics_are_shared = False
+        self._plate_value = numpy.empty(numpy.prod(self._grid[2].shape), dtype=float)
+        self._plate_is_stale = True
+        self._plate_is_shared = False
+        self._sync_inputs(parameters)
+
+        if "restart_file" in self._config:
+            self.load_checkpoint(config_dir / self._config["restart_file"])
+
+    def set_value(self, name: str, src: numpy.ndarray) -> None:
+        if name in self._inputs:
+            self._inputs[name][:] = src
+            return
+        elif name in self._diagnostics or name == PLATE_VAR_NAME:
+            raise ValueError(f"{name}: variable is computed by the model")
+        values = numpy.asarray(src, dtype=float).reshape(-1)
+        if self._value_at_sync is not None:
+            # the cache may hold pointer writes the model has not seen
+            known = self._value_at_sync
+        else:
+            known = None if self._value_is_stale else self._value
+        path = self._write_temperature(values, known)
+        self._value[:] = values
+        self._value_is_stale = False
+        if self._value_at_sync is not None:
+            self._value_at_sync[:] = self._value
+        if path == "unchanged":
+            self._write_counts["unchanged"] += 1
+        else:
+            self._invalidate_derived_values()
+            self._publish_shared_fields()
+
+    def set_value_at_indices(
+        self, name: str, inds: numpy.ndarray, src: numpy.ndarray
+    ) -> None:
+        inds = numpy.asarray(inds, dtype=int)
+        if name in self._inputs:
+            self._inputs[name][inds] = src
+            return
+        elif name in self._diagnostics or name == PLATE_VAR_NAME:
+            raise ValueError(f"{name}: variable is computed by the model")
+        if inds.size == 0:
+            return
+        self._model.set_temperature_at_indices(inds, src)
+        if not self._value_is_stale:
+            self._value[inds] = src
+        if self._value_at_sync is not None:
+            self._value_at_sync[inds] = src
+        self._invalidate_derived_values()
+        self._publish_shared_fields()
+
+    def update(self) -> None:
+        self._push_inputs()
+        self._push_value_ptr()
+        self._model.go()
+        self._pull_value_ptr()
+        self._time["current"] = self._model.ticks * self._time["step"]
+        self._write_snapshots()
+
+    def update_until(self, time: float) -> None:
+        n_steps = (time - self._time["current"]) / self._time["step"]
+        if n_steps < -STEP_TOLERANCE:
+            raise ValueError(f"{time}: time is earlier than the current time")
+        n_steps = max(n_steps, 0.0)
+
+        self._push_inputs()
+        self._push_value_ptr()
+        ticks = self._time["current"] / self._time["step"]
+        lead = math.ceil(ticks - STEP_TOLERANCE) - ticks
+        if STEP_TOLERANCE < lead < n_steps:
+            # finish the tick a fraction left partial, so whole ticks, and
+            # the snapshots due at them, fall on the tick grid
+            self._model.go(0, fraction=lead)
+            self._pull_value_ptr()
+            ticks = float(round(ticks + lead))
+            self._time["current"] = ticks * self._time["step"]
+            self._write_snapshots()
+            n_steps -= lead
+
+        n_ticks = round(n_steps)
+        if abs(n_steps - n_ticks) > STEP_TOLERANCE:
+            n_ticks = int(n_steps)
+        fraction = n_steps - n_ticks
+        if fraction < STEP_TOLERANCE:
+            fraction = 0.0
+
+        chunks = self._snapshot_chunks(ticks, n_ticks, fraction)
+        if "steady_state" in self._config:
+            self._update_until_steady(ticks, chunks, fraction)
+            return
+        elif self._solver is not None:
+            self._update_until_implicit(chunks, fraction)
+            return
+        for chunk in chunks[:-1]:
+            self._model.go(chunk)
+            self._pull_value_ptr()
+            ticks += chunk
+            self._time["current"] = ticks * self._time["step"]
+            self._write_snapshots()
+        self._model.go(chunks[-1], fraction=fraction)
+        self._pull_value_ptr()
+        self._time["current"] = self._model.ticks * self._time["step"]
+        self._write_snapshots()
+
+    def _update_until_steady(self, ticks: float, chunks: list, fraction: float) -> None:
+        """Run chunks of ticks, stopping early once the plate is steady."""
+        tolerance = float(self._config["steady_state"]["tolerance"])
+        interval = int(self._config["steady_state"].get("interval", 10))
+        for chunk in filter(None, chunks):
+            self._residual, n_run = self._model.go_until_steady(
+                chunk, interval, tolerance
+            )
+            if n_run:
+                self._pull_value_ptr()
+                ticks += n_run
+                self._time["current"] = ticks * self._time["step"]
+                self._write_snapshots()
+            if self.is_steady():
+                return
+        if fraction:
+            self._model.go(0, fraction=fraction)
+            self._pull_value_ptr()
+            self._time["current"] = (ticks + fraction) * self._time["step"]
+            self._write_snapshots()
+
+    def _update_until_implicit(self, chunks: list, fraction: float) -> None:
+        """Run chunks of ticks, mostly as implicit steps, and total their error."""
+        self._implicit_error = 0.0
+        for index, chunk in enumerate(chunks):
+            self._go_implicit(chunk, fraction if index == len(chunks) - 1 else 0.0)
+            self._pull_value_ptr()
+            self._time["current"] = self._model.ticks * self._time["step"]
+            self._write_snapshots()
+
+    def _go_implicit(self, n_ticks: int, fraction: float) -> None:
+        """Advance the model by ticks and a fraction, in as many implicit steps as fit.
+
+        The first tick is explicit, so it clamps the edges to their current
+        temperatures as go does, and the ticks left over after the implicit
+        steps are explicit too. The model's fields are transferred only once
+        each way.
+        """
+        n_steps = (n_ticks - 1) // self._solver.n_ticks
+        if n_steps < 1:
+            self._model.go(n_ticks, fraction=fraction)
+            return
 
-        self._model = pynetlogo.NetLogoLink(
-            netlogo_home=self._config["netlogo_home"], gui=False
+        self._model.go(1)
+        state = self._model.get_state()
+        min_pxcor, _, _, max_pycor = self._model.extent
+        self._implicit_error += self._solver.advance(
+            state["temperature"].reshape(self._model.shape),
+            plate_size(self._model.extent),
+            (max_pycor, -min_pxcor),
+            heat_diffusivity(float(state["parameters"]["alpha"])),
+            n_steps,
         )
-        self._model.load_model(str(MODULE_PATH / self._config["model_name"]))
-        self._model.command("setup")
-
-        self._var = BmiVar(
-            dtype=str(self._model.patch_report("temperature").values.dtype),
-            itemsize=self._model.patch_report("temperature").values.itemsize,
-            nbytes=self._model.patch_report("temperature").values.nbytes,
-            location="face",
-            units="C",
-            grid=0,
+        state["ticks"] += n_steps * self._solver.n_ticks
+        self._model.set_state(state)
+        self._model.go(n_ticks - 1 - n_steps * self._solver.n_ticks, fraction=fraction)
+
+    def _cached_value(self) -> numpy.ndarray:
+        """The temperature field, transferred at most once per model state."""
+        if self._value_is_stale:
+            self._model.get_temperature(out=self._value)
+            self._value_is_stale = False
+        return self._value
+
+    def save_checkpoint(self, path) -> None:
+        """Save the model state to a compressed .npz file.
+
+        The checkpoint holds the temperature and old-temperature fields, the
+        tick count, the model parameters and the BMI time settings.
+        """
+        self._push_inputs()
+        self._push_value_ptr()
+        state = self._model.get_state()
+        numpy.savez_compressed(
+            path,
+            temperature=state["temperature"].reshape(self._model.shape),
+            old_temperature=state["old-temperature"].reshape(self._model.shape),
+            ticks=state["ticks"],
+            parameters=json.dumps(state["parameters"]),
+            time=json.dumps(self._time),
+        )
+
+    def load_checkpoint(self, path) -> None:
+        """Restore a model state saved with save_checkpoint."""
+        with numpy.load(path) as checkpoint:
+            if checkpoint["temperature"].shape != tuple(self._model.shape):
+                raise ValueError(
+                    f"{path}: checkpoint grid shape does not match the model's"
+                )
+            parameters = json.loads(str(checkpoint["parameters"]))
+            self._model.set_state(
+                {
+                    "temperature": checkpoint["temperature"].reshape(-1),
+                    "old-temperature": checkpoint["old_temperature"].reshape(-1),
+                    "ticks": float(checkpoint["ticks"]),
+                    "parameters": parameters,
+                }
+            )
+            self._time.update(json.loads(str(checkpoint["time"])))
+        self._sync_inputs(parameters)
+        self._pull_value_ptr()
+        self._time["current"] = self._model.ticks * self._time["step"]
+        self._publish_shared_fields()
+
+    def add_output_stream(
+        self, path, every: int = 1, n_buffers: int = 4, on_full: str = "block"
+    ) -> SnapshotWriter:
+        """Write the temperature field to a file every so many ticks.
+
+        Snapshots, starting with the current one, are copied into a ring of
+        *n_buffers* preallocated buffers and written from a background
+        thread, so writing overlaps with stepping the model. The file is
+        closed by finalize; read it with :func:`heat.stream.read_snapshots`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            Path to the snapshot file.
+        every : int, optional
+            Number of ticks between snapshots, which fall on the multiples of
+            *every* ticks.
+        n_buffers : int, optional
+            Number of snapshots that may wait to be written.
+        on_full : {"block", "drop"}, optional
+            Whether a snapshot waits for a free buffer or is dropped.
+
+        Returns
+        -------
+        SnapshotWriter
+            The writer, which counts the snapshots written and dropped.
+        """
+        writer = SnapshotWriter(
+            path, self._model.shape, n_buffers=n_buffers, on_full=on_full
+        )
+        stream = OutputStream(writer, every, self._time["current"] / self._time["step"])
+        self._streams.append(stream)
+        stream.update(
+            self._time["current"],
+            self._time["current"] / self._time["step"],
+            self._cached_value(),
         )
+        return writer
+
+    def add_shared_memory(self, name: str | None = None) -> SharedFieldWriter:
+        """Publish the temperature field in a named shared memory block.
+
+        The current field, and the field after every update, update_until,
+        set_value, set_value_at_indices, reset and load_checkpoint, is
+        written in place, with its sequence number and model time, for
+        readers in other processes to attach to with
+        :class:`heat.shared.SharedFieldReader`. Writes through get_value_ptr
+        are published with the next update. The block is removed by
+        finalize.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of the shared memory block, or a unique name if not given.
 
+        Returns
+        -------
+        SharedFieldWriter
+            The writer, whose *name* readers attach to.
+        """
+        field = SharedFieldWriter(self._model.shape, name=name)
+        self._shared_fields.append(field)
+        field.write(self._time["current"], self._cached_value())
+        return field
+
+    def _snapshot_chunks(
+        self, ticks: float, n_ticks: int, fraction: float = 0.0
+    ) -> list:
+        """Split a run of ticks at the ticks when snapshots are due.
+
+        If a snapshot is due after the last whole tick, a last chunk of no
+        ticks is left for the *fraction* of a tick that follows it.
+        """
+        due = set()
+        for stream in self._streams:
+            due |= stream.ticks_due(ticks, n_ticks)
+        stops = sorted(due | {n_ticks})
+        chunks = [stop - start for start, stop in zip([0] + stops[:-1], stops)]
+        if fraction and n_ticks in due:
+            chunks.append(0)
+        return chunks
+
+    def _write_snapshots(self) -> None:
+        if not self._streams and not self._shared_fields:
+            return
+        ticks = self._time["current"] / self._time["step"]
+        for stream in self._streams:
+            if stream.is_due(ticks):
+                stream.update(self._time["current"], ticks, self._cached_value())
+        self._publish_shared_fields()
+
+    def _publish_shared_fields(self) -> None:
+        """Write the current field to every shared memory block."""
+        for field in self._shared_fields:
+            field.write(self._time["current"], self._cached_value())
+
+    def _describe(self, extent: tuple) -> None:
+        """Set up the grids and variables of a world, without a model."""
+        min_pxcor, max_pxcor, min_pycor, max_pycor = extent
+        shape = (max_pycor - min_pycor + 1, max_pxcor - min_pxcor + 1)
+        size = plate_size(extent)
+        plate_shape = (2 * size + 1, 2 * size + 1)
+        self._plate_slice = (
+            slice(max_pycor - size, max_pycor + size + 1),
+            slice(-min_pxcor - size, -min_pxcor + size + 1),
+        )
+        self._var = {
+            "plate_surface__temperature": BmiVar(
+                dtype="float64",
+                itemsize=8,
+                nbytes=8 * shape[0] * shape[1],
+                location="face",
+                units="C",
+                grid=0,
+            ),
+            PLATE_VAR_NAME: BmiVar(
+                dtype="float64",
+                itemsize=8,
+                nbytes=8 * plate_shape[0] * plate_shape[1],
+                location="face",
+                units="C",
+                grid=2,
+            ),
+        }
+        for name, units in INPUT_VAR_UNITS.items():
+            self._var[name] = BmiVar(
+                dtype="float64",
+                itemsize=8,
+                nbytes=8,
+                location="node",
+                units=units,
+                grid=1,
+            )
+        for name, (_, units) in DIAGNOSTIC_VARS.items():
+            self._var[name] = BmiVar(
+                dtype="float64",
+                itemsize=8,
+                nbytes=8,
+                location="node",
+                units=units,
+                grid=1,
+            )
         self._grid = {
             0: BmiGridUniformRectilinear(
-                shape=self._model.patch_report("temperature").shape,
+                shape=shape,
                 yx_spacing=(
                     1.0,
                     1.0,
                 ),
                 yx_of_lower_left=(
-                    float(self._model.patch_report("temperature").index.min()),
-                    float(self._model.patch_report("temperature").index.min()),
+                    float(min_pycor),
+                    float(min_pxcor),
                 ),
-            )
+            ),
+            1: BmiGridUniformRectilinear(
+                shape=(),
+                yx_spacing=(),
+                yx_of_lower_left=(),
+            ),
+            2: BmiGridUniformRectilinear(
+                shape=plate_shape,
+                yx_spacing=(
+                    1.0,
+                    1.0,
+                ),
+                yx_of_lower_left=(
+                    float(-size),
+                    float(-size),
+                ),
+            ),
         }
 
-    def set_value(self, name: str, src: numpy.ndarray) -> None:
-        val = self._model.patch_report("temperature")
-        val[:] = src.reshape(val.shape)
-        self._model.patch_set("temperature", val)
+    def _interface(self) -> ModelInterface:
+        """The Interface tab of the configured model, read without NetLogo."""
+        return read_interface(
+            MODULE_PATH / self._config.get("model_name", DEFAULT_MODEL_NAME)
+        )
 
-    def set_value_at_indices(
-        self, name: str, inds: numpy.ndarray, src: numpy.ndarray
-    ) -> None:
-        raise NotImplementedError("set_value_at_indices")
+    def _extent(self) -> tuple:
+        """World bounds centered on the origin, from max_pxcor and max_pycor."""
+        _, default_max_pxcor, _, default_max_pycor = self._interface().extent
+        max_pxcor = self._config.get("max_pxcor", default_max_pxcor)
+        max_pycor = self._config.get("max_pycor", default_max_pycor)
+        return check_extent((-max_pxcor, max_pxcor, -max_pycor, max_pycor))
 
-    def update(self) -> None:
-        self._model.command("repeat 1 [go]")
-        self._time["current"] = self._model.report("ticks") * self._time["step"]
+    def _defaults(self) -> dict:
+        """Parameter values set by the sliders and choosers of the model."""
+        interface = self._interface()
+        values = {
+            **{name: slider.value for name, slider in interface.sliders.items()},
+            **{name: chooser.value for name, chooser in interface.choosers.items()},
+        }
+        return {
+            name: values.get(name, default)
+            for name, default in DEFAULT_PARAMETERS.items()
+        }
 
-    def update_until(self, time: float) -> None:
-        raise NotImplementedError("update_until")
+    def _parameters(self, parameters: dict | None = None) -> dict:
+        """Values of every model parameter, overriding the configuration file."""
+        return {
+            **self._defaults(),
+            **resolve_parameters(self._config.get("parameters", {})),
+            **resolve_parameters(parameters or {}),
+        }
+
+    def _sync_inputs(self, parameters: dict) -> None:
+        """Cache the parameter values the model has been given."""
+        for name in INPUT_VAR_UNITS:
+            value = float(parameters[name])
+            self._inputs.setdefault(name, numpy.empty(1))[:] = value
+            self._inputs_at_sync[name] = value
+
+    def _push_inputs(self) -> None:
+        """Send changed input values to the model, all in one command."""
+        changed = {
+            name: float(value[0])
+            for name, value in self._inputs.items()
+            if value[0] != self._inputs_at_sync[name]
+        }
+        if changed:
+            self._model.set_parameters(changed)
+            self._inputs_at_sync.update(changed)
+
+    def _push_value_ptr(self) -> None:
+        """Send writes made through get_value_ptr back to the model."""
+        if self._value_at_sync is None:
+            return
+        if self._write_temperature(self._value, self._value_at_sync) != "unchanged":
+            self._value_at_sync[:] = self._value
+            self._invalidate_derived_values()
+
+    def _write_temperature(
+        self, values: numpy.ndarray, known: numpy.ndarray | None
+    ) -> str:
+        """Send a temperature field to the model, or only the patches that changed.
+
+        A field that differs from *known*, the field the model has, at no
+        more than a *sparse_fraction* of the patches is sent as one indexed
+        update of those patches. Otherwise, or if the model's field is not known, the
+        whole field is sent. Returns how the field was sent, "indexed" or
+        "full", or "unchanged" if nothing was.
+        """
+        if known is None:
+            changed = None
+        else:
+            changed = numpy.flatnonzero(values != known)
+            if changed.size == 0:
+                return "unchanged"
+
+        sparse_fraction = float(self._config.get("sparse_fraction", SPARSE_FRACTION))
+        if changed is not None and changed.size <= sparse_fraction * values.size:
+            self._model.set_temperature_at_indices(changed, values[changed])
+            path, n_patches = "indexed", changed.size
+        else:
+            self._model.set_temperature(values)
+            path, n_patches = "full", values.size
+        self._write_counts[path] += 1
+        self._write_counts["patches"] += n_patches
+        return path
+
+    def _pull_value_ptr(self) -> None:
+        """Mark the cache stale, or refresh it in place if it has been shared."""
+        if self._value_at_sync is None:
+            self._value_is_stale = True
+        else:
+            self._model.get_temperature(out=self._value)
+            self._value_at_sync[:] = self._value
+        self._invalidate_derived_values()
+
+    def _cached_diagnostics(self) -> dict:
+        """Values of the diagnostic variables, computed once per model state."""
+        if self._diagnostics_are_stale:
+            values = dict(zip(DIAGNOSTICS, self._model.get_diagnostics()))
+            for name, (diagnostic, units) in DIAGNOSTIC_VARS.items():
+                value = values[diagnostic]
+                if units == "C s-1":
+                    value /= self._time["step"]
+                self._diagnostics[name][:] = value
+            self._diagnostics_are_stale = False
+        return self._diagnostics
+
+    def _cached_plate_value(self) -> numpy.ndarray:
+        """The temperatures of the plate region, transferred at most once per state.
+
+        When the whole field is already cached, this is a slice of it.
+        """
+        if self._plate_is_stale:
+            if self._value_is_stale:
+                self._model.get_plate_temperature(out=self._plate_value)
+            else:
+                self._plate_value.reshape(self._grid[2].shape)[:] = self._value.reshape(
+                    self._grid[0].shape
+                )[self._plate_slice]
+            self._plate_is_stale = False
+        return self._plate_value
+
+    def _invalidate_derived_values(self) -> None:
+        """Mark values derived from the field stale, or refresh those shared."""
+        self._diagnostics_are_stale = True
+        if self._diagnostics_are_shared:
+            self._cached_diagnostics()
+        self._plate_is_stale = True
+        if self._plate_is_shared:
+            self._cached_plate_value()
+
+    def _start_instrumentation(self, options: dict, config_dir: pathlib.Path) -> None:
+        """Count and time calls to every BMI method of this instance."""
+        self._stats = Instrumentation(log_interval=options.get("log_interval"))
+        self._stats_file = None
+        if "json_file" in options:
+            self._stats_file = config_dir / options["json_file"]
+        for name in Bmi.__abstractmethods__ - {"initialize"}:
+            self._wrapped_methods[name] = self._stats.timed(name, getattr(self, name))
+            setattr(self, name, self._wrapped_methods[name])
+
+    def _unwrap_methods(self) -> None:
+        """Remove the instrumentation wrappers from the BMI methods."""
+        for name, wrapper in self._wrapped_methods.items():
+            if self.__dict__.get(name) is wrapper:
+                del self.__dict__[name]
+        self._wrapped_methods.clear()
 
-    # A non-BMI helper function.
+    def _stop_instrumentation(self) -> None:
+        """Unwrap the BMI methods and the NetLogo link, and write the stats."""
+        if self._stats is None:
+            return
+        self._unwrap_methods()
+        if self._stats_file is not None:
+            self._stats.dump(self._stats_file)
+
+    # Non-BMI helper functions.
     def get_attribute(self, name: str) -> float:
+        if name in self._inputs:
+            return float(self._inputs[name][0])
         return self._model.report(name)
+
+    def get_write_counts(self) -> dict:
+        """How writes of the temperature field have been sent to the model.
+
+        Writes, by set_value or through get_value_ptr, are counted as
+        *indexed* if only the patches that changed were sent and *full* if
+        the whole field was. *unchanged* counts the set_value calls that
+        changed nothing and sent nothing, and *patches* the patch
+        temperatures sent.
+        """
+        return dict(self._write_counts)
+
+    def get_implicit_error(self) -> float:
+        """How far implicit steps took the last update_until from explicit ticks.
+
+        This is the largest difference, over the patches of the plate,
+        between the temperatures the implicit steps reached and those
+        explicit ticks would have reached. The explicit ticks that follow
+        the implicit steps only shrink that difference, so it bounds the
+        difference at the end of the run; if output streams split the run,
+        the bound is the sum over the chunks. It is NaN until update_until
+        runs, and 0 if it took no implicit steps.
+        """
+        return self._implicit_error
+
+    def get_residual(self) -> float:
+        """The largest change of temperature over the last tick checked.
+
+        This is NaN until update_until has checked for a steady state.
+        """
+        return self._residual
+
+    def is_steady(self) -> bool:
+        """Whether the last check found the plate steady."""
+        if "steady_state" not in self._config:
+            return False
+        return bool(self._residual < float(self._config["steady_state"]["tolerance"]))
+
+    def get_stats(self) -> dict:
+        """Call statistics of each BMI method, if instrumentation is enabled.
+
+        For each method called, the statistics are the number of calls, the
+        total, mean and 50th, 90th and 99th percentile latencies in seconds,
+        the number of NetLogo ``command``, ``report``, ``patch_report`` and
+        ``patch_set`` round trips, and the bytes sent to and received from
+        NetLogo.
+        """
+        if self._stats is None:
+            return {}
+        return self._stats.as_dict()
+
+    def reset(self, parameters: dict | None = None) -> None:
+        """Run the model's setup again, with new parameter values.
+
+        Parameters not given take their values from the configuration file,
+        or else the model's defaults. The workspace is reused, so this is much
+        cheaper than a new initialize.
+        """
+        parameters = self._parameters(parameters)
+        self._model.set_parameters(parameters)
+        self._sync_inputs(parameters)
+        self._setup()
+
+    def setup_tiles(self, members: list, n_columns: int | None = None) -> TileLayout:
+        """Run independent plates, one per ensemble member, as tiles of one world.
+
+        Each tile is the world of the configuration file, with the plate the
+        parameters of a member give it, and tiles fill rows of *n_columns*
+        from the top left of a world resized to hold them. No heat crosses
+        from one tile to another, so each member evolves as it would in a
+        model of its own, but update and update_until advance all of them
+        with one ``go`` per tick, and one transfer of the field brings back
+        every member. Setup runs again, and the time goes back to the start.
+        The tiles stay until the next initialize, and reset lays them out
+        again.
+
+        Output streams and shared memory, which are sized for the world, must
+        be added, and get_value_ptr views of the temperature fields taken,
+        after the tiles are laid out.
+
+        Parameters
+        ----------
+        members : sequence of dict
+            Parameter values of each member, overriding the configuration
+            file.
+        n_columns : int, optional
+            The number of tiles in a row. The default makes the world about
+            as wide as it is tall.
+
+        Returns
+        -------
+        TileLayout
+            The shape of each tile, the number of rows and columns of tiles,
+            and the parameter values of each member.
+        """
+        if len(members) == 0:
+            raise ValueError("an ensemble needs at least one member")
+        if self._streams or self._shared_fields:
+            raise ValueError("tiles must be laid out before adding outputs")
+        if self._value_at_sync is not None or self._plate_is_shared:
+            raise ValueError("tiles must be laid out before taking value pointers")
+        if self._solver is not None:
+            raise ValueError("implicit steps cannot advance tiles")
+        min_pxcor, max_pxcor, min_pycor, max_pycor = self._extent()
+        shape = (max_pycor - min_pycor + 1, max_pxcor - min_pxcor + 1)
+        if n_columns is None:
+            n_columns = math.ceil(math.sqrt(len(members) * shape[0] / shape[1]))
+        n_columns = min(int(n_columns), len(members))
+        if n_columns < 1:
+            raise ValueError(f"{n_columns}: n_columns must be at least 1")
+        n_rows = math.ceil(len(members) / n_columns)
+
+        width, height = n_columns * shape[1], n_rows * shape[0]
+        extent = check_extent((-(width // 2), width // 2, -(height // 2), height // 2))
+        self._tiles = TileLayout(
+            shape=shape,
+            n_rows=n_rows,
+            n_columns=n_columns,
+            members=[self._parameters(member) for member in members],
+        )
+        self._model.resize(extent)
+        self._describe(extent)
+        self._value = numpy.empty(numpy.prod(self._grid[0].shape), dtype=float)
+        self._value_at_sync = None
+        self._plate_value = numpy.empty(numpy.prod(self._grid[2].shape), dtype=float)
+        self._setup()
+        return self._tiles
+
+    def get_tile_values(self, dest: numpy.ndarray | None = None) -> numpy.ndarray:
+        """The temperature fields of the members laid out by setup_tiles.
+
+        Parameters
+        ----------
+        dest : ndarray, optional
+            Where to put the values.
+
+        Returns
+        -------
+        ndarray of float
+            The fields stacked, with shape (members, tile grid size), each
+            in the order of plate_surface__temperature.
+        """
+        if self._tiles is None:
+            raise ValueError("no tiles have been laid out with setup_tiles")
+        (height, width), n_rows, n_columns, members = self._tiles
+        world = self._cached_value().reshape(self._grid[0].shape)
+        tiles = (
+            world[: n_rows * height, : n_columns * width]
+            .reshape(n_rows, height, n_columns, width)
+            .swapaxes(1, 2)
+            .reshape(n_rows * n_columns, height * width)
+        )
+        if dest is None:
+            dest = numpy.empty((len(members), height * width))
+        dest[:] = tiles[: len(members)]
+        return dest
+
+    def _setup(self) -> None:
+        """Run setup, lay out the tiles if there are any, and rewind the time."""
+        self._model.setup()
+        if self._tiles is not None:
+            self._model.setup_tiles(
+                self._tiles.shape, self._tiles.n_columns, self._tiles.members
+            )
+        self._residual = numpy.nan
+        self._implicit_error = numpy.nan
+        self._pull_value_ptr()
+        self._time["current"] = self._model.ticks * self._time["step"]
+        self._publish_shared_fields()
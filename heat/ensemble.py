@@ -0,0 +1,164 @@
+"""Run ensembles of the HeatDiffusion model in a pool of worker processes."""
+
+import itertools
+import multiprocessing.util
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+from .bmi_heatdiffusion import BmiHeatDiffusion
+from .pool import workspace_pool
+
+_worker_model = None
+
+
+def expand_sweep(sweep) -> list[dict]:
+    """List the parameter values of each member of an ensemble.
+
+    Parameters
+    ----------
+    sweep : dict or sequence of dict
+        Either a mapping of parameter names to sequences of values, which
+        is expanded to every combination of them, or a sequence of mappings
+        that each give the parameter values of one member.
+
+    Returns
+    -------
+    list of dict
+        Parameter values, one mapping per member.
+
+    Examples
+    --------
+    >>> from heat.ensemble import expand_sweep
+    >>> expand_sweep({"alpha": [0.5, 1.0], "top-temp": [20.0]})
+    [{'alpha': 0.5, 'top-temp': 20.0}, {'alpha': 1.0, 'top-temp': 20.0}]
+    >>> expand_sweep([{"material-type": "iron"}, {"material-type": "wood"}])
+    [{'material-type': 'iron'}, {'material-type': 'wood'}]
+    """
+    if isinstance(sweep, Mapping):
+        names = list(sweep)
+        return [
+            dict(zip(names, values))
+            for values in itertools.product(*(sweep[name] for name in names))
+        ]
+    return [dict(member) for member in sweep]
+
+
+def run_ensemble(
+    config_file: str,
+    sweep,
+    times,
+    var_name: str = "plate_surface__temperature",
+    max_workers: int | None = None,
+    tiles_per_model: int | None = None,
+) -> numpy.ndarray:
+    """Run an ensemble of models and stack the values of an output variable.
+
+    Each worker process initializes one model from *config_file* and keeps
+    it, and its NetLogo workspace, for every member it runs, finalizing it
+    and killing the workspace when the worker exits. A member resets the model with its parameter
+    values and then runs it through *times*, in increasing order.
+
+    With *tiles_per_model*, a worker instead runs batches of up to that many
+    members at once, as tiles of one world laid out with
+    :meth:`~heat.BmiHeatDiffusion.setup_tiles`, so each ``go`` and each
+    transfer of the field serves the whole batch. Only
+    ``plate_surface__temperature`` can be recorded this way.
+
+    Parameters
+    ----------
+    config_file : str
+        Path to the BMI configuration file shared by all members.
+    sweep : dict or sequence of dict
+        Parameter values of the members, as accepted by :func:`expand_sweep`.
+    times : float or sequence of float
+        Model times at which to record the output variable, in any order.
+    var_name : str, optional
+        Name of the output variable to record.
+    max_workers : int, optional
+        Number of worker processes. The default is the number of processors.
+    tiles_per_model : int, optional
+        Number of members each model runs at once, as tiles of its world.
+
+    Returns
+    -------
+    ndarray of float
+        The recorded values, with shape (members, times, grid size), in
+        the order of *sweep* and *times*.
+    """
+    members = expand_sweep(sweep)
+    times = numpy.atleast_1d(times)
+    order = numpy.argsort(times, kind="stable")
+    unsort = numpy.empty_like(order)
+    unsort[order] = numpy.arange(order.size)
+    times = times[order].tolist()
+    if tiles_per_model is not None:
+        if var_name != "plate_surface__temperature":
+            raise ValueError(f"{var_name}: tiled members record only the temperature")
+        if tiles_per_model < 1:
+            raise ValueError(f"{tiles_per_model}: tiles_per_model must be at least 1")
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_start_worker,
+        initargs=(str(config_file),),
+    ) as executor:
+        if tiles_per_model is None:
+            values = list(
+                executor.map(
+                    _run_member,
+                    members,
+                    itertools.repeat(times),
+                    itertools.repeat(var_name),
+                )
+            )
+        else:
+            batches = [
+                members[start : start + tiles_per_model]
+                for start in range(0, len(members), tiles_per_model)
+            ]
+            values = [
+                value
+                for batch in executor.map(_run_tiles, batches, itertools.repeat(times))
+                for value in batch
+            ]
+    return numpy.stack(values)[:, unsort]
+
+
+def _start_worker(config_file: str) -> None:
+    global _worker_model
+
+    # a worker keeps its model to the end, and skips the atexit handler that
+    # clears the pool, so a pooled workspace would never be killed
+    workspace_pool.enabled = False
+    _worker_model = BmiHeatDiffusion()
+    _worker_model.initialize(config_file)
+    # workers skip atexit, but run multiprocessing finalizers as they exit
+    multiprocessing.util.Finalize(
+        _worker_model, _worker_model.finalize, exitpriority=10
+    )
+
+
+def _run_member(parameters: dict, times: Sequence, var_name: str) -> numpy.ndarray:
+    model = _worker_model
+    model.reset(parameters)
+
+    size = model.get_grid_size(model.get_var_grid(var_name))
+    values = numpy.empty((len(times), size), dtype=model.get_var_type(var_name))
+    for time, value in zip(times, values):
+        model.update_until(time)
+        model.get_value(var_name, value)
+    return values
+
+
+def _run_tiles(members: list, times: Sequence) -> numpy.ndarray:
+    model = _worker_model
+    layout = model.setup_tiles(members)
+
+    size = layout.shape[0] * layout.shape[1]
+    values = numpy.empty((len(members), len(times), size))
+    for index, time in enumerate(times):
+        model.update_until(time)
+        model.get_tile_values(values[:, index])
+    return values
@@ -0,0 +1,440 @@
+"""A NumPy implementation of the HeatDiffusion NetLogo model."""
+
+import math
+
+import numpy
+
+MATERIALS = {
+    "wood": 0.00128,
+    "stone": 0.012,
+    "iron": 0.2034,
+    "aluminum": 0.8418,
+    "silver": 1.7004,
+}
+
+DEFAULT_EXTENT = (-25, 25, -25, 25)
+
+DIAGNOSTICS = (
+    "plate-mean-temp",
+    "plate-min-temp",
+    "plate-max-temp",
+    "top-heat-inflow",
+    "bottom-heat-inflow",
+    "left-heat-inflow",
+    "right-heat-inflow",
+)
+
+TILE_PARAMETERS = (
+    "alpha",
+    "initial-plate-temp",
+    "top-temp",
+    "bottom-temp",
+    "left-temp",
+    "right-temp",
+)
+
+DEFAULT_PARAMETERS = {
+    "alpha": 10.0,
+    "material-type": "aluminum",
+    "initial-plate-temp": 87.0,
+    "top-temp": 81.0,
+    "bottom-temp": 41.0,
+    "left-temp": 3.0,
+    "right-temp": 100.0,
+}
+
+
+def heat_diffusivity(alpha: float) -> float:
+    """The heat-diffusivity reporter of HeatDiffusion.nlogo."""
+    return 0.25 * math.e ** (-1.0 / (alpha + 0.3))
+
+
+def netlogo_round(x: float) -> int:
+    """Round half up, as NetLogo's round primitive does."""
+    return math.floor(x + 0.5)
+
+
+def check_extent(extent: tuple) -> tuple:
+    """Validate world bounds given as (min-pxcor, max-pxcor, min-pycor, max-pycor).
+
+    As with NetLogo's ``resize-world``, the world must contain the origin.
+    """
+    min_pxcor, max_pxcor, min_pycor, max_pycor = (int(bound) for bound in extent)
+    if not (min_pxcor <= 0 <= max_pxcor and min_pycor <= 0 <= max_pycor):
+        raise ValueError(f"{tuple(extent)}: world must contain the origin")
+    return min_pxcor, max_pxcor, min_pycor, max_pycor
+
+
+def plate_size(extent: tuple) -> int:
+    """The plate-size the model's setup computes for a world.
+
+    The plate is 0.6 of the distance from the origin to the nearest side of
+    the world, so it fits worlds of any size and shape.
+    """
+    return netlogo_round(0.6 * min(abs(bound) for bound in extent))
+
+
+def legend_band(extent: tuple) -> int:
+    """The height, in patches, of each band of the color legend.
+
+    The legend grows with the height of the world. It is 0, and not drawn,
+    when the world is too small to hold it.
+    """
+    min_pxcor, max_pxcor, min_pycor, max_pycor = extent
+    if max_pxcor - min_pxcor < 7:
+        return 0
+    return min(max_pycor, -min_pycor) // 12
+
+
+def resolve_parameters(parameters: dict) -> dict:
+    """Validate model parameters and apply the material-type chooser.
+
+    A *material-type* sets *alpha* as the model's ``update-alpha`` procedure
+    would; an explicit *alpha* given alongside it takes precedence.
+    """
+    unknown = set(parameters) - set(DEFAULT_PARAMETERS)
+    if unknown:
+        raise ValueError(f"{', '.join(sorted(unknown))}: unknown parameter")
+
+    resolved = dict(parameters)
+    if "material-type" in resolved:
+        try:
+            alpha = MATERIALS[resolved["material-type"]]
+        except KeyError:
+            raise ValueError(
+                f"{resolved['material-type']}: unknown material-type"
+            ) from None
+        resolved.setdefault("alpha", alpha)
+    return resolved
+
+
+class HeatDiffusion:
+    """Diffuse heat over a 2D plate on a wrapping world of patches.
+
+    This is a port of the ``setup`` and ``go`` procedures of
+    HeatDiffusion.nlogo. Patch values are stored in the order of NetLogo's
+    ``sort patches``: rows run from max-pycor down to min-pycor and columns
+    from min-pxcor to max-pxcor, the layout of ``NetLogoLink.patch_report``.
+
+    Parameters
+    ----------
+    extent : tuple of int, optional
+        The world bounds as (min-pxcor, max-pxcor, min-pycor, max-pycor).
+    parameters : dict, optional
+        Slider and chooser values, keyed by their NetLogo names.
+
+    Examples
+    --------
+    >>> from heat.heat import HeatDiffusion
+    >>> model = HeatDiffusion(parameters={"top-temp": 100.0})
+    >>> model.setup()
+    >>> model.shape
+    (51, 51)
+    >>> model.go(10)
+    >>> model.ticks
+    10.0
+    """
+
+    def __init__(self, extent: tuple = DEFAULT_EXTENT, parameters: dict | None = None):
+        self._parameters = dict(DEFAULT_PARAMETERS)
+        self._parameters.update(resolve_parameters(parameters or {}))
+        self._set_extent(check_extent(extent))
+        self.ticks = 0.0
+
+    @property
+    def extent(self) -> tuple:
+        return self._extent
+
+    @property
+    def shape(self) -> tuple:
+        return self._pxcor.shape
+
+    @property
+    def heat_diffusivity(self) -> float:
+        return heat_diffusivity(self._parameters["alpha"])
+
+    def resize(self, extent: tuple) -> None:
+        """Change the world bounds, as ``resize-world`` does, before setup.
+
+        Parameters
+        ----------
+        extent : tuple of int
+            The world bounds as (min-pxcor, max-pxcor, min-pycor, max-pycor).
+        """
+        extent = check_extent(extent)
+        if extent != self._extent:
+            self._set_extent(extent)
+
+    def set_parameters(self, parameters: dict) -> None:
+        self._parameters.update(resolve_parameters(parameters))
+        self._edge_index, self._edge_values = self._edge_temperatures()
+
+    def report(self, name: str):
+        if name in self._parameters:
+            return self._parameters[name]
+        elif name == "ticks":
+            return self.ticks
+        elif name == "plate-size":
+            return self.plate_size
+        elif name == "heat-diffusivity":
+            return self.heat_diffusivity
+        else:
+            raise ValueError(f"{name}: unknown attribute")
+
+    def setup(self) -> None:
+        """Set the initial plate, edge and legend temperatures."""
+        x, y = numpy.abs(self._pxcor), numpy.abs(self._pycor)
+
+        self.temperature.fill(0.0)
+        self.temperature[(x < self.plate_size) & (y < self.plate_size)] = (
+            self._parameters["initial-plate-temp"]
+        )
+        self._set_edge_temperatures(self.temperature)
+        self.old_temperature[...] = self.temperature
+        self._draw_legend()
+
+        self._tile_k = None
+        self.ticks = 0.0
+
+    def setup_tiles(self, tile_shape: tuple, n_columns: int, members: list) -> None:
+        """Lay out independent plates, one per member, on tiles of the world.
+
+        This is a port of the ``setup-tiles`` procedure. Tiles of
+        *tile_shape* patches fill rows of *n_columns* tiles from the top left
+        of the world, in the order of *members*, and each holds the plate and
+        edges that setup would give a world of that shape and the member's
+        parameters, without a legend. Patches outside every tile are held at
+        0. Until the next setup, go diffuses heat within each plate with the
+        heat diffusivity of its member, and leaves every other patch alone,
+        so no heat crosses from one tile to another.
+
+        Parameters
+        ----------
+        tile_shape : tuple of int
+            The number of rows and columns of patches in a tile, both odd.
+        n_columns : int
+            The number of tiles in a row.
+        members : list of dict
+            Parameter values of each member, with every name in
+            TILE_PARAMETERS.
+        """
+        height, width = tile_shape
+        min_pxcor, _, _, max_pycor = self._extent
+        size = plate_size(
+            ((1 - width) // 2, (width - 1) // 2, (1 - height) // 2, (height - 1) // 2)
+        )
+
+        column = (self._pxcor - min_pxcor) // width
+        row = (max_pycor - self._pycor) // height
+        member = row * n_columns + column
+        in_tile = (column < n_columns) & (member < len(members))
+        x = self._pxcor - (min_pxcor + column * width + (width - 1) // 2)
+        y = self._pycor - (max_pycor - row * height - (height - 1) // 2)
+
+        values = numpy.array(
+            [
+                [float(parameters[name]) for name in TILE_PARAMETERS]
+                for parameters in members
+            ]
+        )
+        alpha, initial, top, bottom, left, right = numpy.moveaxis(
+            values[numpy.where(in_tile, member, 0)], -1, 0
+        )
+        plate = in_tile & (numpy.abs(x) < size) & (numpy.abs(y) < size)
+
+        self.temperature.fill(0.0)
+        self.temperature[plate] = initial[plate]
+        for where, value in (
+            ((x >= size) & (numpy.abs(y) < size), right),
+            ((x <= -size) & (numpy.abs(y) < size), left),
+            ((y >= size) & (numpy.abs(x) < size), top),
+            ((y <= -size) & (numpy.abs(x) < size), bottom),
+            ((x >= size) & (y >= size), 0.5 * (right + top)),
+            ((x >= size) & (y <= -size), 0.5 * (right + bottom)),
+            ((x <= -size) & (y >= size), 0.5 * (left + top)),
+            ((x <= -size) & (y <= -size), 0.5 * (left + bottom)),
+        ):
+            where &= in_tile
+            self.temperature[where] = value[where]
+        self.old_temperature[...] = self.temperature
+
+        self._tile_k = numpy.zeros(self.shape)
+        self._tile_k[plate] = heat_diffusivity(alpha[plate])
+        self.ticks = 0.0
+
+    def go(self, n_ticks: int = 1, fraction: float = 0.0) -> None:
+        """Advance the model by a number of ticks and a fraction of one."""
+        k = self.heat_diffusivity if self._tile_k is None else self._tile_k
+        for _ in range(n_ticks):
+            self._diffuse(k)
+            self.ticks += 1.0
+        if fraction:
+            self._diffuse(fraction * k)
+            self.ticks += fraction
+
+    def go_until_steady(self, n_ticks: int, interval: int, tolerance: float) -> tuple:
+        """Advance up to *n_ticks* ticks, stopping once the plate is steady.
+
+        The ticks run in chunks of *interval*. After each chunk, the residual,
+        the largest change of temperature over its last tick, is compared
+        with *tolerance*, and the run stops if it is smaller.
+
+        Returns
+        -------
+        tuple of (float, int)
+            The last residual and the number of ticks run.
+        """
+        residual, n_run = math.nan, 0
+        while n_run < n_ticks:
+            chunk = min(interval, n_ticks - n_run)
+            self.go(chunk)
+            n_run += chunk
+            residual = float(numpy.abs(self.temperature - self.old_temperature).max())
+            if residual < tolerance:
+                break
+        return residual, n_run
+
+    def get_diagnostics(self) -> numpy.ndarray:
+        """The values of the model's diagnostics reporter, named in DIAGNOSTICS.
+
+        These are the mean, minimum and maximum temperatures of the plate
+        inside its edges, and the heat that flows into the plate across its
+        top, bottom, left and right edges in a tick.
+        """
+        _, _, _, max_pycor = self._extent
+        center = -self._extent[0]
+        size, k = self.plate_size, self.heat_diffusivity
+        top, bottom = max_pycor - size + 1, max_pycor + size - 1
+        left, right = center - size + 1, center + size - 1
+        rows, cols = slice(top, bottom + 1), slice(left, right + 1)
+
+        temperature = self.temperature
+        plate = temperature[rows, cols]
+        return numpy.array(
+            [
+                plate.mean(),
+                plate.min(),
+                plate.max(),
+                k * (temperature[top - 1, cols] - temperature[top, cols]).sum(),
+                k * (temperature[bottom + 1, cols] - temperature[bottom, cols]).sum(),
+                k * (temperature[rows, left - 1] - temperature[rows, left]).sum(),
+                k * (temperature[rows, right + 1] - temperature[rows, right]).sum(),
+            ]
+        )
+
+    def get_temperature(self, out: numpy.ndarray | None = None) -> numpy.ndarray:
+        if out is None:
+            out = numpy.empty(self.temperature.size)
+        out[:] = self.temperature.reshape(-1)
+        return out
+
+    def set_temperature(self, values: numpy.ndarray) -> None:
+        self.temperature.reshape(-1)[:] = values
+
+    def get_state(self) -> dict:
+        """The fields, tick count and parameters that make up a model state."""
+        return {
+            "temperature": self.temperature.reshape(-1).copy(),
+            "old-temperature": self.old_temperature.reshape(-1).copy(),
+            "ticks": self.ticks,
+            "parameters": dict(self._parameters),
+        }
+
+    def set_state(self, state: dict) -> None:
+        self.set_parameters(state["parameters"])
+        self.temperature.reshape(-1)[:] = state["temperature"]
+        self.old_temperature.reshape(-1)[:] = state["old-temperature"]
+        self.ticks = float(state["ticks"])
+
+    def get_plate_temperature(self, out: numpy.ndarray | None = None) -> numpy.ndarray:
+        """Temperatures of the plate and its edges, |pxcor|, |pycor| <= plate-size."""
+        min_pxcor, _, _, max_pycor = self._extent
+        size = self.plate_size
+        plate = self.temperature[
+            max_pycor - size : max_pycor + size + 1,
+            -min_pxcor - size : -min_pxcor + size + 1,
+        ]
+        if out is None:
+            out = numpy.empty(plate.size)
+        out.reshape(plate.shape)[:] = plate
+        return out
+
+    def get_temperature_at_indices(
+        self, inds: numpy.ndarray, out: numpy.ndarray | None = None
+    ) -> numpy.ndarray:
+        return numpy.take(self.temperature, inds, out=out)
+
+    def set_temperature_at_indices(
+        self, inds: numpy.ndarray, values: numpy.ndarray
+    ) -> None:
+        self.temperature.reshape(-1)[inds] = values
+
+    def close(self) -> None:
+        pass
+
+    def _diffuse(self, k: float) -> None:
+        """Apply the neighbors4 stencil to a snapshot, then clamp edges."""
+        self.old_temperature[...] = self.temperature
+        old, total = self.old_temperature, self._work
+
+        total[:-1] = old[1:]
+        total[-1] = old[0]
+        total[1:] += old[:-1]
+        total[0] += old[-1]
+        total[:, :-1] += old[:, 1:]
+        total[:, -1] += old[:, 0]
+        total[:, 1:] += old[:, :-1]
+        total[:, 0] += old[:, -1]
+
+        numpy.multiply(total, k, out=self.temperature)
+        self.temperature += (1.0 - 4.0 * k) * old
+        if self._tile_k is None:
+            self._set_edge_temperatures(self.temperature)
+
+    def _set_extent(self, extent: tuple) -> None:
+        self._extent = extent
+        min_pxcor, max_pxcor, min_pycor, max_pycor = extent
+
+        self._pxcor, self._pycor = numpy.meshgrid(
+            numpy.arange(min_pxcor, max_pxcor + 1),
+            numpy.arange(max_pycor, min_pycor - 1, -1),
+        )
+        self.plate_size = plate_size(extent)
+
+        self.temperature = numpy.zeros(self.shape)
+        self.old_temperature = numpy.zeros(self.shape)
+        self._work = numpy.empty(self.shape)
+        self._tile_k = None
+        self._edge_index, self._edge_values = self._edge_temperatures()
+
+    def _set_edge_temperatures(self, temperature: numpy.ndarray) -> None:
+        temperature.reshape(-1)[self._edge_index] = self._edge_values
+
+    def _edge_temperatures(self) -> tuple:
+        """Flat indices and values of the patches set-edge-temperatures fixes."""
+        x, y, size = self._pxcor, self._pycor, self.plate_size
+        top, bottom, left, right = (
+            float(self._parameters[f"{edge}-temp"])
+            for edge in ("top", "bottom", "left", "right")
+        )
+
+        values = numpy.full(self.shape, numpy.nan)
+        values[(x >= size) & (numpy.abs(y) < size)] = right
+        values[(x <= -size) & (numpy.abs(y) < size)] = left
+        values[(y >= size) & (numpy.abs(x) < size)] = top
+        values[(y <= -size) & (numpy.abs(x) < size)] = bottom
+        values[(x >= size) & (y >= size)] = 0.5 * (right + top)
+        values[(x >= size) & (y <= -size)] = 0.5 * (right + bottom)
+        values[(x <= -size) & (y >= size)] = 0.5 * (left + top)
+        values[(x <= -size) & (y <= -size)] = 0.5 * (left + bottom)
+
+        index = numpy.flatnonzero(~numpy.isnan(values))
+        return index, values.reshape(-1)[index]
+
+    def _draw_legend(self) -> None:
+        """Write the temperatures of the color-scale legend patches."""
+        max_pycor = self._extent[3]
+        band = legend_band(self._extent)
+        for y in range(10 if band else 0):
+            row = max_pycor - (y * band - 5 * band - 1)
+            self.temperature[row - band + 1 : row + 1, 5:8] = y * 10.0
@@ -0,0 +1,121 @@
+"""Read static metadata of a NetLogo model from its .nlogo file, without a JVM."""
+
+import functools
+import pathlib
+import re
+from collections import namedtuple
+
+SECTION_SEPARATOR = "@#$#@#$#@"
+
+ModelInterface = namedtuple("ModelInterface", ["extent", "sliders", "choosers"])
+Slider = namedtuple("Slider", ["minimum", "maximum", "value", "increment"])
+Chooser = namedtuple("Chooser", ["choices", "value"])
+
+
+def parse_literals(text: str) -> list:
+    """Split a line of NetLogo literals, as in a chooser, into Python values.
+
+    Examples
+    --------
+    >>> from heat.metadata import parse_literals
+    >>> parse_literals('"wood" "stone" 1.5')
+    ['wood', 'stone', 1.5]
+    """
+    values = []
+    for string, number in re.findall(r'"((?:[^"\\]|\\.)*)"|(\S+)', text):
+        if number:
+            values.append(float(number))
+        else:
+            values.append(re.sub(r"\\(.)", r"\1", string))
+    return values
+
+
+def parse_bound(text: str) -> float | str:
+    """Parse a slider bound or increment, which may be a NetLogo reporter.
+
+    Examples
+    --------
+    >>> from heat.metadata import parse_bound
+    >>> parse_bound("1.0E-4")
+    0.0001
+    >>> parse_bound("max-pxcor")
+    'max-pxcor'
+    """
+    try:
+        return float(text)
+    except ValueError:
+        return text.strip()
+
+
+def parse_interface(text: str) -> ModelInterface:
+    """Parse the world extent, sliders and choosers of a model's Interface tab.
+
+    Parameters
+    ----------
+    text : str
+        The contents of a .nlogo file.
+
+    Returns
+    -------
+    ModelInterface
+        The world extent, as (min-pxcor, max-pxcor, min-pycor, max-pycor),
+        and mappings of slider and chooser variables to their settings. The
+        bounds and increment of a slider are numbers or, if they are
+        reporters, their NetLogo code.
+    """
+    sections = text.split(SECTION_SEPARATOR)
+    if len(sections) < 2:
+        raise ValueError("not a .nlogo file: missing Interface section")
+
+    extent = None
+    sliders, choosers = {}, {}
+    for widget in re.split(r"\n\s*\n", sections[1].strip()):
+        lines = widget.splitlines()
+        if lines[0] == "GRAPHICS-WINDOW":
+            extent = tuple(int(line) for line in lines[17:21])
+        elif lines[0] == "SLIDER":
+            minimum, maximum, increment = (
+                parse_bound(line) for line in (lines[7], lines[8], lines[10])
+            )
+            sliders[lines[6]] = Slider(minimum, maximum, float(lines[9]), increment)
+        elif lines[0] == "CHOOSER":
+            choices = parse_literals(lines[7])
+            choosers[lines[6]] = Chooser(choices, choices[int(lines[8])])
+    if extent is None:
+        raise ValueError("not a .nlogo file: missing GRAPHICS-WINDOW")
+
+    return ModelInterface(extent=extent, sliders=sliders, choosers=choosers)
+
+
+def read_interface(path) -> ModelInterface:
+    """Read the Interface tab of a .nlogo file, parsing each file only once.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Path to a .nlogo file.
+
+    Returns
+    -------
+    ModelInterface
+        The world extent and the sliders and choosers of the model.
+
+    Examples
+    --------
+    >>> from heat.bmi_heatdiffusion import MODULE_PATH
+    >>> from heat.metadata import read_interface
+    >>> interface = read_interface(MODULE_PATH / "HeatDiffusion.nlogo")
+    >>> interface.extent
+    (-25, 25, -25, 25)
+    >>> interface.sliders["top-temp"].value
+    81.0
+    >>> interface.choosers["material-type"].value
+    'aluminum'
+    """
+    return _read_interface(pathlib.Path(path).resolve())
+
+
+@functools.cache
+def _read_interface(path: pathlib.Path) -> ModelInterface:
+    with open(path, "r", encoding="utf-8") as fp:
+        return parse_interface(fp.read())
@@ -0,0 +1,281 @@
+"""Drive the HeatDiffusion model in a headless NetLogo workspace."""
+
+import numpy
+
+from .heat import DEFAULT_PARAMETERS, TILE_PARAMETERS, check_extent, resolve_parameters
+
+KERNELS = ("neighbors4", "diffuse4")
+
+
+def netlogo_literal(value) -> str:
+    """Format a Python value as a NetLogo literal.
+
+    Examples
+    --------
+    >>> from heat.netlogo import netlogo_literal
+    >>> netlogo_literal(3)
+    '3.0'
+    >>> print(netlogo_literal('say "hi"'))
+    "say \\"hi\\""
+    """
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return repr(float(value))
+
+
+def netlogo_list(values) -> str:
+    """Format a sequence of numbers as a NetLogo list literal.
+
+    Examples
+    --------
+    >>> from heat.netlogo import netlogo_list
+    >>> netlogo_list([1, 2.5, -3])
+    '[1 2.5 -3]'
+    """
+    return "[" + " ".join(repr(value) for value in values) + "]"
+
+
+class NetLogoHeatDiffusion:
+    """The HeatDiffusion model run through ``pynetlogo.NetLogoLink``.
+
+    This mirrors the interface of :class:`heat.heat.HeatDiffusion`, so the BMI
+    can drive either one. Patch values move as flat lists in the order of
+    ``sort patches``, the layout of ``NetLogoLink.patch_report``, without
+    going through pandas.
+
+    Parameters
+    ----------
+    model_path : str or path-like
+        Path to HeatDiffusion.nlogo.
+    netlogo_home : str, optional
+        Path to the NetLogo installation.
+    parameters : dict, optional
+        Slider and chooser values, keyed by their NetLogo names.
+    render : bool, optional
+        If False, skip coloring and labeling patches in setup and go.
+    kernel : {"neighbors4", "diffuse4"}, optional
+        The diffusion kernel: the model's original patch loop, or NetLogo's
+        built-in ``diffuse4`` primitive.
+    """
+
+    def __init__(
+        self,
+        model_path,
+        netlogo_home: str | None = None,
+        parameters: dict | None = None,
+        render: bool = True,
+        kernel: str = "neighbors4",
+    ):
+        import pynetlogo
+
+        self._link = pynetlogo.NetLogoLink(netlogo_home=netlogo_home, gui=False)
+        self._link.load_model(str(model_path))
+        self.configure(render=render, kernel=kernel)
+
+        self._set_extent(
+            self._link.report("(list min-pxcor max-pxcor min-pycor max-pycor)")
+        )
+        self.set_parameters(parameters or {})
+
+    @property
+    def link(self):
+        """The NetLogoLink that runs the model."""
+        return self._link
+
+    @link.setter
+    def link(self, link) -> None:
+        self._link = link
+
+    @property
+    def extent(self) -> tuple:
+        return self._extent
+
+    @property
+    def shape(self) -> tuple:
+        min_pxcor, max_pxcor, min_pycor, max_pycor = self._extent
+        return (max_pycor - min_pycor + 1, max_pxcor - min_pxcor + 1)
+
+    @property
+    def ticks(self) -> float:
+        return float(self._link.report("ticks"))
+
+    def configure(self, render: bool = True, kernel: str = "neighbors4") -> None:
+        """Set the render? switch and kernel chooser."""
+        if kernel not in KERNELS:
+            raise ValueError(f"{kernel}: unknown kernel")
+        self._link.command(
+            f"set render? {str(bool(render)).lower()}"
+            f" set kernel {netlogo_literal(kernel)}"
+        )
+
+    def resize(self, extent: tuple) -> None:
+        """Change the world bounds with ``resize-world``, before setup.
+
+        Parameters
+        ----------
+        extent : tuple of int
+            The world bounds as (min-pxcor, max-pxcor, min-pycor, max-pycor).
+        """
+        extent = check_extent(extent)
+        if extent != self._extent:
+            self._link.command(
+                f"resize-world {' '.join(str(bound) for bound in extent)}"
+            )
+            self._set_extent(extent)
+
+    def set_parameters(self, parameters: dict) -> None:
+        parameters = resolve_parameters(parameters)
+
+        commands = []
+        if "material-type" in parameters:
+            commands.append(
+                f"set material-type {netlogo_literal(parameters.pop('material-type'))}"
+            )
+        for name, value in parameters.items():
+            commands.append(f"set {name} {netlogo_literal(value)}")
+        if commands:
+            self._link.command(" ".join(commands))
+
+    def report(self, name: str):
+        return self._link.report(name)
+
+    def setup(self) -> None:
+        self._link.command("setup")
+
+    def setup_tiles(self, tile_shape: tuple, n_columns: int, members: list) -> None:
+        """Lay out independent plates, one per member, on tiles of the world.
+
+        See :meth:`heat.heat.HeatDiffusion.setup_tiles`. The parameter values
+        of every member go to NetLogo in one command.
+        """
+        height, width = tile_shape
+        values = " ".join(
+            netlogo_list([float(parameters[name]) for name in TILE_PARAMETERS])
+            for parameters in members
+        )
+        self._link.command(f"setup-tiles {width} {height} {n_columns} [{values}]")
+
+    def go(self, n_ticks: int = 1, fraction: float = 0.0) -> None:
+        commands = []
+        if n_ticks:
+            commands.append(f"repeat {n_ticks} [go]")
+        if fraction:
+            commands.append(f"go-fraction {netlogo_literal(fraction)}")
+        if commands:
+            self._link.command(" ".join(commands))
+
+    def go_until_steady(self, n_ticks: int, interval: int, tolerance: float) -> tuple:
+        """Advance up to *n_ticks* ticks, stopping once the plate is steady.
+
+        NetLogo runs the ticks and checks the residual after each chunk of
+        *interval* ticks; only the residual and tick count come back.
+        """
+        if n_ticks < 1:
+            return float("nan"), 0
+        self._link.command(
+            f"go-until-steady {int(n_ticks)} {int(interval)} {netlogo_literal(tolerance)}"
+        )
+        residual, n_run = self._link.report("(list residual steady-ticks)")
+        return float(residual), int(n_run)
+
+    def get_diagnostics(self) -> numpy.ndarray:
+        """The values of the model's diagnostics reporter, named in DIAGNOSTICS."""
+        return numpy.asarray(self._link.report("diagnostics"), dtype=float)
+
+    def get_temperature(self, out: numpy.ndarray | None = None) -> numpy.ndarray:
+        values = self._link.report("map [p -> [temperature] of p] sorted-patches")
+        if out is None:
+            return numpy.asarray(values, dtype=float)
+        out[:] = values
+        return out
+
+    def get_plate_temperature(self, out: numpy.ndarray | None = None) -> numpy.ndarray:
+        """Temperatures of the plate and its edges, |pxcor|, |pycor| <= plate-size."""
+        values = self._link.report("map [p -> [temperature] of p] sorted-plate-patches")
+        if out is None:
+            return numpy.asarray(values, dtype=float)
+        out[:] = values
+        return out
+
+    def set_temperature(self, values: numpy.ndarray) -> None:
+        values = netlogo_list(numpy.asarray(values, dtype=float).reshape(-1).tolist())
+        self._link.command(
+            f"(foreach sorted-patches {values} [[p t] -> ask p [set temperature t]])"
+        )
+
+    def get_state(self) -> dict:
+        """The fields, tick count and parameters that make up a model state."""
+        fields = self._link.report(
+            "(sentence map [p -> [temperature] of p] sorted-patches"
+            " map [p -> [old-temperature] of p] sorted-patches)"
+        )
+        temperature, old_temperature = numpy.split(
+            numpy.asarray(fields, dtype=float), 2
+        )
+
+        names = [name for name in DEFAULT_PARAMETERS if name != "material-type"]
+        values = self._link.report(f"(list ticks {' '.join(names)})")
+        parameters = dict(zip(names, (float(value) for value in values[1:])))
+        parameters["material-type"] = self._link.report("material-type")
+
+        return {
+            "temperature": temperature,
+            "old-temperature": old_temperature,
+            "ticks": float(values[0]),
+            "parameters": parameters,
+        }
+
+    def set_state(self, state: dict) -> None:
+        self.set_parameters(state["parameters"])
+
+        temperature = netlogo_list(
+            numpy.asarray(state["temperature"], dtype=float).tolist()
+        )
+        old_temperature = netlogo_list(
+            numpy.asarray(state["old-temperature"], dtype=float).tolist()
+        )
+        self._link.command(
+            f"(foreach sorted-patches {temperature} {old_temperature}"
+            " [[p t old] -> ask p [set temperature t set old-temperature old]])"
+            f" reset-ticks tick-advance {netlogo_literal(state['ticks'])}"
+        )
+
+    def get_temperature_at_indices(
+        self, inds: numpy.ndarray, out: numpy.ndarray | None = None
+    ) -> numpy.ndarray:
+        xs, ys = self._patch_coordinates(inds)
+        values = self._link.report(
+            f"(map [[x y] -> [temperature] of patch x y] {xs} {ys})"
+        )
+        if out is None:
+            return numpy.asarray(values, dtype=float)
+        out[:] = values
+        return out
+
+    def set_temperature_at_indices(
+        self, inds: numpy.ndarray, values: numpy.ndarray
+    ) -> None:
+        xs, ys = self._patch_coordinates(inds)
+        values = netlogo_list(numpy.asarray(values, dtype=float).tolist())
+        self._link.command(
+            f"(foreach {xs} {ys} {values} [[x y t] -> ask patch x y [set temperature t]])"
+        )
+
+    def close(self) -> None:
+        self._link.kill_workspace()
+
+    def _set_extent(self, extent: tuple) -> None:
+        self._extent = tuple(int(bound) for bound in extent)
+        min_pxcor, max_pxcor, min_pycor, max_pycor = self._extent
+        pxcor, pycor = numpy.meshgrid(
+            numpy.arange(min_pxcor, max_pxcor + 1),
+            numpy.arange(max_pycor, min_pycor - 1, -1),
+        )
+        self._pxcor, self._pycor = pxcor.reshape(-1), pycor.reshape(-1)
+
+    def _patch_coordinates(self, inds: numpy.ndarray) -> tuple:
+        """NetLogo lists of the pxcor and pycor of patches at flat indices."""
+        return (
+            netlogo_list(self._pxcor[inds].tolist()),
+            netlogo_list(self._pycor[inds].tolist()),
+        )
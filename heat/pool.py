@@ -0,0 +1,92 @@
+"""Keep idle NetLogo workspaces warm for reuse."""
+
+import atexit
+import threading
+import time
+from collections.abc import Callable, Hashable
+
+
+class WorkspacePool:
+    """A pool of idle workspaces, keyed by what was loaded into them.
+
+    Starting a JVM-backed workspace and loading a model into it is slow.
+    Rather than closing a workspace it no longer needs, a caller can return
+    it to the pool, where the next caller that asks for the same key picks
+    it up. Workspaces are any objects with a ``close`` method. Set
+    ``enabled`` to False to turn pooling off: workspaces are then created
+    and closed as if there were no pool.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        The most idle workspaces to keep, over all keys.
+    max_idle : float, optional
+        Seconds after which an idle workspace is closed. Eviction is lazy:
+        idle workspaces are only checked on checkout and checkin, not on a
+        timer, so one can outlive *max_idle* if the pool is not used.
+
+    Examples
+    --------
+    >>> from heat.pool import WorkspacePool
+    >>> class Workspace:
+    ...     def close(self):
+    ...         pass
+    >>> pool = WorkspacePool(max_size=1)
+    >>> workspace = pool.checkout("key", Workspace)
+    >>> pool.checkin("key", workspace)
+    >>> pool.checkout("key", Workspace) is workspace
+    True
+    """
+
+    def __init__(self, max_size: int = 2, max_idle: float = 600.0):
+        self.enabled = True
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def checkout(self, key: Hashable, create: Callable):
+        """Take the most recently used idle workspace for *key*, or create one."""
+        if not self.enabled:
+            return create()
+        with self._lock:
+            self._evict(self.max_idle)
+            for i in reversed(range(len(self._idle))):
+                idle_key, workspace, _ = self._idle[i]
+                if idle_key == key:
+                    del self._idle[i]
+                    return workspace
+        return create()
+
+    def checkin(self, key: Hashable, workspace) -> None:
+        """Return a workspace to the pool, closing it if the pool is full."""
+        if not self.enabled:
+            workspace.close()
+            return
+        with self._lock:
+            self._idle.append((key, workspace, time.monotonic()))
+            self._evict(self.max_idle)
+            while len(self._idle) > self.max_size:
+                self._idle.pop(0)[1].close()
+
+    def clear(self) -> None:
+        """Close every idle workspace."""
+        with self._lock:
+            self._evict(0.0)
+
+    def _evict(self, max_idle: float) -> None:
+        now = time.monotonic()
+        idle = []
+        for key, workspace, since in self._idle:
+            if now - since >= max_idle:
+                workspace.close()
+            else:
+                idle.append((key, workspace, since))
+        self._idle = idle
+
+
+workspace_pool = WorkspacePool()
+atexit.register(workspace_pool.clear)
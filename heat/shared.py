@@ -0,0 +1,258 @@
+"""Publish a field in shared memory for readers in other processes."""
+
+import os
+import time
+from collections import namedtuple
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy
+
+MAGIC = b"HEATSHM\0"
+HEADER_SIZE = 64
+HEADER_DTYPE = numpy.dtype(
+    [
+        ("magic", "S8"),
+        ("seq", "<u8"),
+        ("time", "<f8"),
+        ("shape", "<i8", (2,)),
+        ("dtype", "S8"),
+    ]
+)
+
+Frame = namedtuple("Frame", ["seq", "time", "value"])
+
+_created = set()
+
+
+class SharedFieldWriter:
+    """Publish frames of a field in a named shared memory block.
+
+    The block is a small header, holding a sequence number, the model time,
+    and the shape and type of the field, followed by the field itself. Each
+    frame is written in place, and the sequence number makes the header a
+    seqlock: it is odd while a frame is being written and goes up by two
+    with every frame, so the *n*-th frame has sequence number 2 *n*.
+    Readers, with :class:`SharedFieldReader`, use it to tell a torn frame,
+    one overwritten while they read it, and a stale frame, one they have
+    already seen, from a new one.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the field.
+    dtype : str, optional
+        Data type of the field.
+    name : str, optional
+        Name of the shared memory block. If not given, a unique name is
+        chosen; it is the *name* attribute.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> from heat.shared import SharedFieldReader, SharedFieldWriter
+    >>> with SharedFieldWriter((2, 3)) as writer:
+    ...     seq = writer.write(0.5, numpy.arange(6.0))
+    ...     with SharedFieldReader(writer.name) as reader:
+    ...         frame = reader.read()
+    >>> frame.seq, frame.time
+    (2, 0.5)
+    >>> frame.value
+    array([[0., 1., 2.],
+           [3., 4., 5.]])
+    """
+
+    def __init__(self, shape: tuple, dtype="float64", name: str | None = None):
+        self.shape = tuple(int(n) for n in shape)
+        if len(self.shape) != 2:
+            raise ValueError(f"{self.shape}: shape must be two-dimensional")
+        dtype = numpy.dtype(dtype)
+        nbytes = self.shape[0] * self.shape[1] * dtype.itemsize
+
+        self._shm = SharedMemory(name=name, create=True, size=HEADER_SIZE + nbytes)
+        self.name = self._shm.name
+        _created.add(self._shm._name)
+        self._header = numpy.ndarray((), dtype=HEADER_DTYPE, buffer=self._shm.buf)
+        self._value = numpy.ndarray(
+            self.shape, dtype=dtype, buffer=self._shm.buf, offset=HEADER_SIZE
+        )
+        self._header["seq"] = 0
+        self._header["time"] = numpy.nan
+        self._header["shape"] = self.shape
+        self._header["dtype"] = dtype.str.encode("ascii")
+        self._header["magic"] = MAGIC
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last frame written."""
+        return int(self._header["seq"])
+
+    def write(self, time: float, values: numpy.ndarray) -> int:
+        """Publish a frame, returning its sequence number."""
+        seq = int(self._header["seq"])
+        self._header["seq"] = seq + 1
+        self._value.reshape(-1)[:] = values.reshape(-1)
+        self._header["time"] = time
+        self._header["seq"] = seq + 2
+        return seq + 2
+
+    def close(self) -> None:
+        """Detach from and remove the shared memory block.
+
+        Readers that are attached keep their mapping, but no new reader can
+        attach.
+        """
+        if self._shm is None:
+            return
+        self._header = self._value = None
+        self._shm.close()
+        self._shm.unlink()
+        _created.discard(self._shm._name)
+        self._shm = None
+
+
+class SharedFieldReader:
+    """Attach to a field published by a :class:`SharedFieldWriter`.
+
+    :meth:`read` copies a consistent frame. To work on the field in place
+    without a copy, take a sequence number with :meth:`begin_read`, use the
+    read-only *value* array, and then check :meth:`is_torn`: if the frame
+    changed in the meantime, what was read may mix two frames.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory block.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> from heat.shared import SharedFieldReader, SharedFieldWriter
+    >>> with SharedFieldWriter((1, 2)) as writer:
+    ...     with SharedFieldReader(writer.name) as reader:
+    ...         seq = writer.write(0.1, numpy.ones(2))
+    ...         seq = reader.begin_read()
+    ...         total = reader.value.sum()
+    ...         print(total, reader.is_torn(seq))
+    ...         seq = writer.write(0.2, numpy.zeros(2))
+    ...         print(reader.is_torn(2))
+    2.0 False
+    True
+    """
+
+    def __init__(self, name: str):
+        self._shm = _attach(name)
+        self.name = name
+        header = numpy.ndarray((), dtype=HEADER_DTYPE, buffer=self._shm.buf)
+        if header["magic"] != MAGIC.rstrip(b"\0"):
+            del header
+            self._shm.close()
+            raise ValueError(f"{name}: not a shared field")
+        self._header = header
+        self.shape = tuple(int(n) for n in header["shape"])
+        self.dtype = numpy.dtype(header["dtype"].item().decode("ascii"))
+        self.value = numpy.ndarray(
+            self.shape, dtype=self.dtype, buffer=self._shm.buf, offset=HEADER_SIZE
+        )
+        self.value.flags.writeable = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def seq(self) -> int:
+        """Sequence number in the header, odd while a frame is being written."""
+        return int(self._header["seq"])
+
+    @property
+    def time(self) -> float:
+        """Model time of the last frame written."""
+        return float(self._header["time"])
+
+    def begin_read(self, timeout: float = 1.0) -> int:
+        """Wait until no frame is being written, and return its sequence number.
+
+        Raises
+        ------
+        TimeoutError
+            If a frame is still being written after *timeout* seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while (seq := self.seq) % 2:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{self.name}: frame {seq // 2 + 1} is not done")
+            time.sleep(0)
+        return seq
+
+    def is_torn(self, seq: int) -> bool:
+        """Whether the frame changed since *seq* was returned by begin_read."""
+        return self.seq != seq
+
+    def read(self, out: numpy.ndarray | None = None, timeout: float = 1.0) -> Frame:
+        """Copy the latest frame, retrying until a copy is not torn.
+
+        Parameters
+        ----------
+        out : ndarray, optional
+            Where to copy the field.
+        timeout : float, optional
+            Seconds to retry before giving up.
+
+        Returns
+        -------
+        Frame
+            The sequence number, the model time and the field of the frame.
+            A sequence number seen before marks a stale frame.
+
+        Raises
+        ------
+        TimeoutError
+            If no copy is consistent within *timeout* seconds.
+        """
+        if out is None:
+            out = numpy.empty(self.shape, dtype=self.dtype)
+        deadline = time.monotonic() + timeout
+        while True:
+            seq = self.begin_read(timeout=max(deadline - time.monotonic(), 0.0))
+            out.reshape(-1)[:] = self.value.reshape(-1)
+            frame_time = self.time
+            if not self.is_torn(seq):
+                return Frame(seq=seq, time=frame_time, value=out)
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{self.name}: every copy was torn")
+
+    def close(self) -> None:
+        """Detach from the shared memory block.
+
+        Arrays returned as *value* must not be used after this.
+        """
+        if self._shm is None:
+            return
+        self._header = self.value = None
+        self._shm.close()
+        self._shm = None
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to a shared memory block without taking ownership of it.
+
+    Before Python 3.13, attaching registers the block with the resource
+    tracker of the reader's process, which would remove it when the reader
+    exits. A block created by this process stays registered, for its writer.
+    """
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = SharedMemory(name=name)
+        if os.name == "posix" and shm._name not in _created:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
@@ -0,0 +1,178 @@
+"""Count and time BMI calls and the NetLogo round trips they make."""
+
+import collections
+import contextlib
+import functools
+import json
+import logging
+import time
+
+import numpy
+
+logger = logging.getLogger(__name__)
+
+ROUND_TRIPS = ("command", "report", "patch_report", "patch_set")
+
+
+class CallStats:
+    """Counters for calls to one method."""
+
+    def __init__(self, max_samples: int = 10000):
+        self.calls = 0
+        self.total = 0.0
+        self.latencies = collections.deque(maxlen=max_samples)
+        self.round_trips = dict.fromkeys(ROUND_TRIPS, 0)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def as_dict(self) -> dict:
+        if self.latencies:
+            p50, p90, p99 = numpy.percentile(self.latencies, [50, 90, 99])
+        else:
+            p50 = p90 = p99 = 0.0
+        return {
+            "calls": self.calls,
+            "total": self.total,
+            "mean": self.total / self.calls if self.calls else 0.0,
+            "p50": float(p50),
+            "p90": float(p90),
+            "p99": float(p99),
+            **self.round_trips,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+        }
+
+
+class Instrumentation:
+    """Statistics of the BMI calls made on one model.
+
+    Only the outermost BMI call in progress is counted, and round trips to
+    NetLogo, and the bytes they move, are charged to it.
+
+    Parameters
+    ----------
+    log_interval : float, optional
+        If given, log the statistics at most this often, in seconds.
+
+    Examples
+    --------
+    >>> from heat.stats import Instrumentation
+    >>> stats = Instrumentation()
+    >>> square = stats.timed("square", lambda x: x * x)
+    >>> square(3)
+    9
+    >>> stats.as_dict()["square"]["calls"]
+    1
+    """
+
+    def __init__(self, log_interval: float | None = None):
+        self.log_interval = log_interval
+        self._stats = collections.defaultdict(CallStats)
+        self._active = []
+        self._last_log = time.monotonic()
+
+    @contextlib.contextmanager
+    def measure(self, name: str):
+        """Count and time the enclosed block as a call to *name*.
+
+        Calls made inside another call, as when one BMI method calls another,
+        are part of the outer call and are not counted on their own.
+        """
+        if self._active:
+            yield
+            return
+        self._active.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_call(name, time.perf_counter() - start)
+            self._active.pop()
+
+    def timed(self, name: str, func):
+        """Wrap *func* to count and time its calls under *name*."""
+
+        @functools.wraps(func)
+        def _timed(*args, **kwds):
+            with self.measure(name):
+                return func(*args, **kwds)
+
+        return _timed
+
+    def add_call(self, name: str, elapsed: float) -> None:
+        stats = self._stats[name]
+        stats.calls += 1
+        stats.total += elapsed
+        stats.latencies.append(elapsed)
+
+        if (
+            self.log_interval is not None
+            and time.monotonic() - self._last_log >= self.log_interval
+        ):
+            self._last_log = time.monotonic()
+            logger.info("BMI call statistics: %s", json.dumps(self.as_dict()))
+
+    def add_round_trip(self, kind: str, sent: int, received: int) -> None:
+        stats = self._stats[self._active[0] if self._active else "<none>"]
+        stats.round_trips[kind] += 1
+        stats.bytes_sent += sent
+        stats.bytes_received += received
+
+    def as_dict(self) -> dict:
+        return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    def dump(self, path) -> None:
+        """Write the statistics to a JSON file."""
+        with open(path, "w") as fp:
+            json.dump(self.as_dict(), fp, indent=2)
+
+
+class InstrumentedLink:
+    """Wrap a NetLogoLink to count its round trips and the bytes moved.
+
+    Parameters
+    ----------
+    link : NetLogoLink
+        The link to wrap.
+    stats : Instrumentation
+        Where to record the round trips.
+    """
+
+    def __init__(self, link, stats: Instrumentation):
+        self.link = link
+        self.stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self.link, name)
+
+    def command(self, netlogo_command):
+        self.link.command(netlogo_command)
+        self.stats.add_round_trip("command", len(netlogo_command), 0)
+
+    def report(self, netlogo_reporter):
+        result = self.link.report(netlogo_reporter)
+        self.stats.add_round_trip("report", len(netlogo_reporter), _nbytes(result))
+        return result
+
+    def patch_report(self, attribute):
+        result = self.link.patch_report(attribute)
+        self.stats.add_round_trip(
+            "patch_report", len(attribute), int(result.values.nbytes)
+        )
+        return result
+
+    def patch_set(self, attribute, data):
+        self.link.patch_set(attribute, data)
+        self.stats.add_round_trip(
+            "patch_set", len(attribute) + int(data.values.nbytes), 0
+        )
+
+
+def _nbytes(value) -> int:
+    if isinstance(value, numpy.ndarray):
+        return int(value.nbytes)
+    elif isinstance(value, str):
+        return len(value)
+    elif isinstance(value, (list, tuple)):
+        return sum(_nbytes(item) for item in value)
+    return 8
@@ -0,0 +1,239 @@
+"""Write snapshots of a field to disk from a background thread."""
+
+import json
+import math
+import queue
+import threading
+
+import numpy
+
+MAGIC = b"HEATSNAP"
+HEADER_SIZE = 4096
+TICK_TOLERANCE = 1e-9
+
+
+def snapshot_dtype(shape: tuple, dtype="float64") -> numpy.dtype:
+    """The record type of a snapshot file: a time and a field."""
+    return numpy.dtype([("time", "<f8"), ("value", numpy.dtype(dtype), tuple(shape))])
+
+
+def read_snapshots(path) -> numpy.memmap:
+    """Memory-map the snapshots written to a file by a SnapshotWriter.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Path to a snapshot file.
+
+    Returns
+    -------
+    memmap
+        A record array with fields *time* and *value*, one record per
+        snapshot.
+    """
+    with open(path, "rb") as fp:
+        header = fp.read(HEADER_SIZE)
+        if not header.startswith(MAGIC):
+            raise ValueError(f"{path}: not a snapshot file")
+        n_bytes = fp.seek(0, 2) - HEADER_SIZE
+
+    info = json.loads(header[len(MAGIC) :].rstrip(b"\0"))
+    dtype = snapshot_dtype(info["shape"], info["dtype"])
+    return numpy.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=HEADER_SIZE,
+        shape=(n_bytes // dtype.itemsize,),
+    )
+
+
+class SnapshotWriter:
+    """Append snapshots of a field to a file from a background thread.
+
+    Snapshots are copied into a ring of preallocated buffers and the caller
+    returns at once. A writer thread appends whatever buffers are pending to
+    the file in one chunk, and hands them back to the ring. The file is a
+    fixed-size header followed by (time, field) records, which
+    :func:`read_snapshots` memory-maps.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Path to the snapshot file, which is overwritten.
+    shape : tuple of int
+        Shape of the field.
+    dtype : str, optional
+        Data type of the field.
+    n_buffers : int, optional
+        Size of the ring of buffers, which bounds the memory in use.
+    on_full : {"block", "drop"}, optional
+        What to do with a snapshot when every buffer is waiting to be
+        written: wait for one to be free, or discard the snapshot.
+
+    Examples
+    --------
+    >>> import numpy, pathlib, tempfile
+    >>> from heat.stream import SnapshotWriter, read_snapshots
+    >>> path = pathlib.Path(tempfile.mkdtemp()) / "snapshots.bin"
+    >>> with SnapshotWriter(path, (2, 3)) as writer:
+    ...     writer.write(0.0, numpy.zeros(6))
+    ...     writer.write(0.1, numpy.ones(6))
+    True
+    True
+    >>> snapshots = read_snapshots(path)
+    >>> snapshots["time"]
+    memmap([0. , 0.1])
+    >>> snapshots["value"].shape
+    (2, 2, 3)
+    """
+
+    def __init__(
+        self,
+        path,
+        shape: tuple,
+        dtype="float64",
+        n_buffers: int = 4,
+        on_full: str = "block",
+    ):
+        if on_full not in ("block", "drop"):
+            raise ValueError(f"{on_full}: on_full must be 'block' or 'drop'")
+        if n_buffers < 1:
+            raise ValueError(f"{n_buffers}: n_buffers must be at least 1")
+
+        self.shape = tuple(int(n) for n in shape)
+        self.on_full = on_full
+        self.n_written = 0
+        self.n_dropped = 0
+
+        self._ring = numpy.empty(n_buffers, dtype=snapshot_dtype(self.shape, dtype))
+        self._free = queue.Queue()
+        for index in range(n_buffers):
+            self._free.put(index)
+        self._pending = queue.Queue()
+        self._error = None
+
+        header = MAGIC + json.dumps(
+            {"shape": self.shape, "dtype": numpy.dtype(dtype).str}
+        ).encode("ascii")
+        self._file = open(path, "wb")  # noqa: SIM115, closed by close()
+        try:
+            self._file.write(header.ljust(HEADER_SIZE, b"\0"))
+            self._thread = threading.Thread(target=self._drain, daemon=True)
+            self._thread.start()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, time: float, values: numpy.ndarray) -> bool:
+        """Queue a snapshot, returning False if it was dropped."""
+        self._raise_if_failed()
+        try:
+            index = self._free.get(block=self.on_full == "block")
+        except queue.Empty:
+            self.n_dropped += 1
+            return False
+
+        self._ring["time"][index] = time
+        self._ring["value"][index].reshape(-1)[:] = values.reshape(-1)
+        self._pending.put(index)
+        return True
+
+    def close(self) -> None:
+        """Write every pending snapshot and close the file."""
+        if self._file.closed:
+            return
+        self._pending.put(None)
+        self._thread.join()
+        self._file.close()
+        self._raise_if_failed()
+
+    def _drain(self) -> None:
+        is_open = True
+        while is_open:
+            indices = [self._pending.get()]
+            while not self._pending.empty():
+                indices.append(self._pending.get())
+            if indices[-1] is None:
+                is_open = False
+                indices.pop()
+
+            try:
+                for index in indices:
+                    self._file.write(memoryview(self._ring[index : index + 1]))
+                self._file.flush()
+                self.n_written += len(indices)
+            except OSError as error:
+                self._error = error
+            for index in indices:
+                self._free.put(index)
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+
+class OutputStream:
+    """Feed a SnapshotWriter every so many model ticks.
+
+    After the first snapshot, snapshots are due at the multiples of *every*
+    ticks, whatever fractions of a tick the model has taken. A snapshot due
+    at a tick the model steps over is written at the first tick after it.
+
+    Parameters
+    ----------
+    writer : SnapshotWriter
+        Where to write the snapshots.
+    every : int
+        Number of ticks between snapshots.
+    ticks : float
+        The tick count at which the first snapshot is due.
+
+    Examples
+    --------
+    >>> from heat.stream import OutputStream
+    >>> stream = OutputStream(None, every=4, ticks=0.0)
+    >>> stream.next_after(2.5), stream.next_after(4.0)
+    (4, 8)
+    >>> stream.next_ticks = stream.next_after(2.5)
+    >>> sorted(stream.ticks_due(3.0, 10))
+    [1, 5, 9]
+    """
+
+    def __init__(self, writer: SnapshotWriter, every: int, ticks: float):
+        if every < 1:
+            raise ValueError(f"{every}: every must be at least 1")
+        self.writer = writer
+        self.every = int(every)
+        self.next_ticks = float(ticks)
+
+    def next_after(self, ticks: float) -> int:
+        """The first multiple of *every* after *ticks*."""
+        return self.every * (math.floor(ticks / self.every + TICK_TOLERANCE) + 1)
+
+    def ticks_due(self, ticks: float, n_ticks: int) -> set:
+        """Offsets, from *ticks*, of the snapshots due within *n_ticks*."""
+        offset = math.ceil(self.next_ticks - ticks - TICK_TOLERANCE)
+        if offset < 1:
+            offset += self.every * math.ceil((1 - offset) / self.every)
+        return set(range(offset, n_ticks + 1, self.every))
+
+    def is_due(self, ticks: float) -> bool:
+        """Whether a snapshot is due at *ticks*."""
+        return ticks >= self.next_ticks - TICK_TOLERANCE
+
+    def update(self, time: float, ticks: float, values: numpy.ndarray) -> None:
+        """Write a snapshot if one is due at *ticks*."""
+        if not self.is_due(ticks):
+            return
+        self.writer.write(time, values)
+        self.next_ticks = self.next_after(ticks)
+
+    def close(self) -> None:
+        self.writer.close()
@@ -9,7 +9,7 @@ PROJECT = "bmi-example-pynetlogo"
 PACKAGE = "heat"
 HERE = pathlib.Path(__file__)
 ROOT = HERE.parent
-PATHS = [PACKAGE, "examples", "tests", HERE.name]
+PATHS = [PACKAGE, "benchmarks", "examples", "tests", HERE.name]
 PYTHON_VERSIONS = ["3.10", "3.11", "3.12", "3.13"]
 
 
@@ -48,6 +48,20 @@ def test_bmi(session: nox.Session) -> None:
     )
 
 
+@nox.session(python=PYTHON_VERSIONS)
+def benchmark(session: nox.Session) -> None:
+    """Benchmark the BMI, saving results under .benchmarks to compare commits."""
+    session.install(".[testing]")
+    session.install("pytest-benchmark")
+
+    args = [
+        "benchmarks",
+        "--benchmark-autosave",
+        "--benchmark-group-by=func",
+    ] + session.posargs
+    session.run("pytest", *args)
+
+
 @nox.session(name="run-examples", python=PYTHON_VERSIONS)
 def run_examples(session: nox.Session):
     """Run Python script examples."""
@@ -103,6 +117,7 @@ def clean(session):
     shutil.rmtree("docs/build", ignore_errors=True)
     shutil.rmtree(f"{PACKAGE}.egg-info", ignore_errors=True)
     shutil.rmtree(".pytest_cache", ignore_errors=True)
+    shutil.rmtree(".benchmarks", ignore_errors=True)
     shutil.rmtree(".venv", ignore_errors=True)
     if os.path.exists(".coverage"):
         os.remove(".coverage")
@@ -0,0 +1,26 @@
+import itertools
+
+import pytest
+import yaml
+
+
+@pytest.fixture
+def make_config(tmp_path):
+    """Write a copy of a config file with some HeatDiffusion settings changed.
+
+    The copy is written to *tmp_path*, so relative paths in the settings
+    resolve there.
+    """
+    names = (f"config-{n}.yaml" for n in itertools.count())
+
+    def _make_config(base, **overrides):
+        with open(base) as fp:
+            config = yaml.safe_load(fp)
+        config["HeatDiffusion"].update(overrides)
+
+        path = tmp_path / next(names)
+        with open(path, "w") as fp:
+            yaml.safe_dump(config, fp)
+        return path
+
+    return _make_config
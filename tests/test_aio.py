@@ -0,0 +1,86 @@
+"""Test the asyncio interface to the model."""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from heat import AsyncBmiHeatDiffusion, BmiHeatDiffusion
+
+VAR_NAME = "plate_surface__temperature"
+
+
+def run_sync(config_file, top_temp, stop_time):
+    model = BmiHeatDiffusion()
+    model.initialize(config_file)
+    model.set_value("top-temp", np.array([top_temp]))
+    model.update_until(stop_time)
+    value = model.get_value(VAR_NAME, np.empty(model.get_grid_size(0)))
+    model.finalize()
+    return value
+
+
+async def run_async(config_file, top_temp, stop_time):
+    model = AsyncBmiHeatDiffusion()
+    await model.initialize(config_file)
+    src = np.array([top_temp])
+    model.set_value("top-temp", src)
+    src[:] = -1.0
+    model.update_until(stop_time)
+    value = await model.get_value(VAR_NAME, np.empty(model.bmi.get_grid_size(0)))
+    await model.finalize()
+    return value
+
+
+def test_components_run_concurrently(shared_datadir):
+    config_file = shared_datadir / "numpy.yaml"
+
+    async def run_both():
+        return await asyncio.gather(
+            run_async(config_file, 20.0, 1.0), run_async(config_file, 90.0, 2.0)
+        )
+
+    actual = asyncio.run(run_both())
+    assert_array_equal(actual[0], run_sync(config_file, 20.0, 1.0))
+    assert_array_equal(actual[1], run_sync(config_file, 90.0, 2.0))
+
+
+def test_calls_run_on_one_thread(shared_datadir):
+    threads = set()
+
+    async def run():
+        model = AsyncBmiHeatDiffusion()
+        update = model.bmi.update
+
+        def recording_update():
+            threads.add(threading.get_ident())
+            update()
+
+        model.bmi.update = recording_update
+        await model.initialize(shared_datadir / "numpy.yaml")
+        await asyncio.gather(*(model.update() for _ in range(5)))
+        assert model.bmi.get_current_time() == 0.5
+        await model.finalize()
+
+    asyncio.run(run())
+    assert len(threads) == 1
+    assert threading.get_ident() not in threads
+
+
+def test_event_loop_is_not_blocked(shared_datadir):
+    async def run():
+        model = AsyncBmiHeatDiffusion()
+        await model.initialize(shared_datadir / "numpy.yaml")
+        model.bmi.update = lambda: time.sleep(0.2)
+
+        n_ticks = 0
+        update = model.update()
+        while not update.done():
+            n_ticks += 1
+            await asyncio.sleep(0.01)
+        await model.finalize()
+        return n_ticks
+
+    assert asyncio.run(run()) > 5
@@ -0,0 +1,113 @@
+"""Test the NumPy backend against the NetLogo model."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from heat import BmiHeatDiffusion
+from heat.heat import HeatDiffusion, heat_diffusivity
+
+CONFIG_FILE = "config.yaml"
+NUMPY_CONFIG_FILE = "numpy.yaml"
+GRID_ID = 0
+VAR_NAME = "plate_surface__temperature"
+
+
+def test_numpy_backend_grid(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / NUMPY_CONFIG_FILE)
+
+    shape = np.empty(2, dtype=np.int32)
+    assert_array_equal(model.get_grid_shape(GRID_ID, shape), (51, 51))
+    origin = np.empty(2, dtype=float)
+    assert_array_equal(model.get_grid_origin(GRID_ID, origin), (-25.0, -25.0))
+    assert model.get_var_nbytes(VAR_NAME) == 20808
+
+    model.finalize()
+
+
+def test_numpy_backend_setup():
+    model = HeatDiffusion()
+    model.setup()
+
+    assert model.plate_size == 15
+    assert model.report("plate-size") == 15
+
+    # Patch (0, 0) is in the middle of the plate, patch (15, 0) on its right edge.
+    assert model.temperature[25, 25] == 87.0
+    assert model.temperature[25, 40] == 100.0
+    assert model.temperature[10, 25] == 81.0
+    assert model.temperature[40, 25] == 41.0
+    assert model.temperature[25, 10] == 3.0
+    assert model.temperature[10, 40] == 0.5 * (100.0 + 81.0)
+
+
+def test_numpy_backend_go():
+    model = HeatDiffusion(parameters={"material-type": "iron"})
+    model.setup()
+    before = model.temperature.copy()
+    model.go()
+
+    k = heat_diffusivity(0.2034)
+    expected = k * (before[24, 25] + before[26, 25] + before[25, 24] + before[25, 26])
+    expected += (1 - 4 * k) * before[25, 25]
+
+    assert model.ticks == 1.0
+    assert model.temperature[25, 25] == pytest.approx(expected)
+    assert model.temperature[25, 40] == 100.0
+    assert_array_equal(model.old_temperature, before)
+
+
+def test_numpy_backend_parameters():
+    with pytest.raises(ValueError):
+        HeatDiffusion(parameters={"beta": 1.0})
+    with pytest.raises(ValueError):
+        HeatDiffusion(parameters={"material-type": "other"})
+
+    model = HeatDiffusion(parameters={"material-type": "wood", "alpha": 2.0})
+    assert model.report("alpha") == 2.0
+
+
+def test_numpy_backend_matches_netlogo(shared_datadir):
+    netlogo = BmiHeatDiffusion()
+    netlogo.initialize(shared_datadir / CONFIG_FILE)
+    native = BmiHeatDiffusion()
+    native.initialize(shared_datadir / NUMPY_CONFIG_FILE)
+
+    expected = np.empty(netlogo.get_grid_size(GRID_ID))
+    actual = np.empty_like(expected)
+    for _ in range(10):
+        netlogo.get_value(VAR_NAME, expected)
+        native.get_value(VAR_NAME, actual)
+        assert_allclose(actual, expected, rtol=1e-12)
+
+        netlogo.update()
+        native.update()
+    assert native.get_current_time() == pytest.approx(netlogo.get_current_time())
+
+    netlogo.finalize()
+    native.finalize()
+
+
+def test_numpy_backend_update_until(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / NUMPY_CONFIG_FILE)
+    stepped = HeatDiffusion()
+    stepped.setup()
+
+    model.update_until(0.3)
+    stepped.go(3)
+    assert model.get_current_time() == pytest.approx(0.3)
+    assert model.get_attribute("ticks") == 3.0
+
+    actual = np.empty(model.get_grid_size(GRID_ID))
+    assert_array_equal(model.get_value(VAR_NAME, actual), stepped.get_temperature())
+
+    model.update_until(0.35)
+    assert model.get_current_time() == pytest.approx(0.35)
+    assert model.get_attribute("ticks") == pytest.approx(3.5)
+
+    with pytest.raises(ValueError):
+        model.update_until(0.1)
+
+    model.finalize()
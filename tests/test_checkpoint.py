@@ -0,0 +1,54 @@
+"""Test saving and restoring model checkpoints."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from heat import BmiHeatDiffusion
+
+VAR_NAME = "plate_surface__temperature"
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_restart_from_checkpoint(shared_datadir, tmp_path, config_file, make_config):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+    model.reset({"material-type": "iron", "top-temp": 20.0})
+    model.update_until(1.25)
+    model.save_checkpoint(tmp_path / "checkpoint.npz")
+
+    restarted = BmiHeatDiffusion()
+    restarted.initialize(
+        make_config(shared_datadir / config_file, restart_file="checkpoint.npz")
+    )
+    assert restarted.get_current_time() == pytest.approx(1.25)
+    assert restarted.get_attribute("alpha") == pytest.approx(0.2034)
+    assert restarted.get_attribute("top-temp") == pytest.approx(20.0)
+
+    expected = np.empty(model.get_grid_size(0))
+    actual = np.empty_like(expected)
+    for _ in range(2):
+        model.get_value(VAR_NAME, expected)
+        restarted.get_value(VAR_NAME, actual)
+        assert_array_equal(actual, expected)
+
+        model.update()
+        restarted.update()
+
+    model.finalize()
+    restarted.finalize()
+
+
+def test_checkpoint_grid_must_match(shared_datadir, tmp_path):
+    np.savez(
+        tmp_path / "checkpoint.npz",
+        temperature=np.zeros((3, 3)),
+        old_temperature=np.zeros((3, 3)),
+        ticks=0.0,
+    )
+
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+    with pytest.raises(ValueError):
+        model.load_checkpoint(tmp_path / "checkpoint.npz")
+    model.finalize()
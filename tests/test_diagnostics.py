@@ -0,0 +1,117 @@
+"""Test the diagnostic output variables computed by the model."""
+
+import numpy as np
+import pytest
+
+from heat import BmiHeatDiffusion
+
+VAR_NAME = "plate_surface__temperature"
+SCALAR_GRID_ID = 1
+INFLOWS = [
+    "plate_top_edge__heat_inflow_rate",
+    "plate_bottom_edge__heat_inflow_rate",
+    "plate_left_edge__heat_inflow_rate",
+    "plate_right_edge__heat_inflow_rate",
+]
+
+
+def get_scalar(model, name):
+    return model.get_value(name, np.empty(1))[0]
+
+
+def get_plate(model):
+    shape = model.get_grid_shape(0, np.empty(2, dtype=int))
+    temperature = model.get_value(VAR_NAME, np.empty(shape[0] * shape[1]))
+    size = int(model.get_attribute("plate-size"))
+    center = shape // 2
+    return temperature.reshape(shape)[
+        center[0] - size + 1 : center[0] + size, center[1] - size + 1 : center[1] + size
+    ]
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_diagnostic_var_functions(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+
+    for name in model.get_output_var_names()[2:]:
+        assert model.get_var_grid(name) == SCALAR_GRID_ID
+        assert model.get_var_type(name) == "float64"
+        assert model.get_var_nbytes(name) == 8
+    assert model.get_var_units("plate_surface__mean_of_temperature") == "C"
+    assert model.get_var_units("plate_top_edge__heat_inflow_rate") == "C s-1"
+
+    model.finalize()
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_plate_temperature_diagnostics(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+    model.update_until(2.0)
+
+    plate = get_plate(model)
+    assert get_scalar(model, "plate_surface__mean_of_temperature") == pytest.approx(
+        plate.mean()
+    )
+    assert get_scalar(model, "plate_surface__min_of_temperature") == pytest.approx(
+        plate.min()
+    )
+    assert get_scalar(model, "plate_surface__max_of_temperature") == pytest.approx(
+        plate.max()
+    )
+
+    model.finalize()
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_heat_inflow_balances_plate_heat(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+    model.update_until(1.0)
+
+    heat = get_plate(model).sum()
+    inflow = sum(get_scalar(model, name) for name in INFLOWS)
+    model.update()
+
+    assert get_plate(model).sum() - heat == pytest.approx(
+        inflow * model.get_time_step()
+    )
+
+    model.finalize()
+
+
+def test_diagnostics_are_cached(shared_datadir, monkeypatch):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    calls = []
+    get_diagnostics = model._model.get_diagnostics
+
+    def counting_get_diagnostics():
+        calls.append(1)
+        return get_diagnostics()
+
+    monkeypatch.setattr(model._model, "get_diagnostics", counting_get_diagnostics)
+
+    for name in model.get_output_var_names()[2:]:
+        get_scalar(model, name)
+    assert len(calls) == 1
+
+    ptr = model.get_value_ptr("plate_surface__mean_of_temperature")
+    before = ptr[0]
+    model.update()
+    assert len(calls) == 2
+    assert ptr[0] != before
+
+    model.finalize()
+
+
+def test_diagnostics_are_not_settable(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    with pytest.raises(ValueError):
+        model.set_value("plate_surface__mean_of_temperature", np.array([0.0]))
+
+    model.finalize()
@@ -0,0 +1,92 @@
+"""Test running ensembles of models."""
+
+import multiprocessing
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from heat import BmiHeatDiffusion
+from heat.ensemble import run_ensemble
+from heat.heat import HeatDiffusion
+
+CONFIG_FILE = "numpy.yaml"
+VAR_NAME = "plate_surface__temperature"
+
+
+def test_run_ensemble(shared_datadir):
+    sweep = {"alpha": [0.5, 2.0], "top-temp": [10.0, 90.0]}
+    values = run_ensemble(
+        shared_datadir / CONFIG_FILE, sweep, times=[0.5, 1.0], max_workers=2
+    )
+    assert values.shape == (4, 2, 2601)
+
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / CONFIG_FILE)
+    expected = np.empty(model.get_grid_size(0))
+    for member, parameters in [
+        (1, {"alpha": 0.5, "top-temp": 90.0}),
+        (2, {"alpha": 2.0, "top-temp": 10.0}),
+    ]:
+        model.reset(parameters)
+        model.update_until(1.0)
+        model.get_value(VAR_NAME, expected)
+        assert_array_almost_equal(values[member, 1], expected)
+    model.finalize()
+
+
+def test_times_in_any_order(shared_datadir):
+    sweep = {"alpha": [0.5, 2.0]}
+    values = run_ensemble(
+        shared_datadir / CONFIG_FILE, sweep, times=[1.0, 0.2, 0.5], max_workers=1
+    )
+    expected = run_ensemble(
+        shared_datadir / CONFIG_FILE, sweep, times=[0.2, 0.5, 1.0], max_workers=1
+    )
+    assert_array_almost_equal(values, expected[:, [2, 0, 1]])
+
+
+def test_workers_finalize_their_models(shared_datadir, tmp_path, make_config):
+    config_file = make_config(
+        shared_datadir / CONFIG_FILE, instrumentation={"json_file": "stats.json"}
+    )
+
+    run_ensemble(config_file, {"alpha": [0.5]}, times=[0.1], max_workers=1)
+    assert (tmp_path / "stats.json").is_file()
+
+
+def test_reset(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / CONFIG_FILE)
+    model.update_until(1.0)
+
+    model.reset({"material-type": "iron"})
+    assert model.get_current_time() == 0.0
+    assert model.get_attribute("alpha") == 0.2034
+
+    model.reset()
+    assert model.get_attribute("alpha") == 10.0
+
+    model.finalize()
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="workers must inherit the patched workspace class",
+)
+def test_workers_kill_their_workspaces(shared_datadir, tmp_path, monkeypatch):
+    class Workspace(HeatDiffusion):
+        def __init__(self, model_path, netlogo_home=None):
+            super().__init__()
+
+        def configure(self, render=True, kernel="neighbors4"):
+            pass
+
+        def close(self):
+            (tmp_path / "killed").touch()
+
+    monkeypatch.setattr("heat.bmi_heatdiffusion.NetLogoHeatDiffusion", Workspace)
+    run_ensemble(
+        shared_datadir / "config.yaml", {"alpha": [0.5]}, times=[0.1], max_workers=1
+    )
+    assert (tmp_path / "killed").is_file()
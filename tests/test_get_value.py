@@ -27,17 +27,55 @@ def test_get_value(shared_datadir):
     model.finalize()
 
 
-def test_get_value_ptr():
+def test_get_value_ptr(shared_datadir):
     model = BmiHeatDiffusion()
-    with pytest.raises(NotImplementedError):
-        model.get_value_ptr(VAR_NAME)
+    model.initialize(shared_datadir / CONFIG_FILE)
+
+    ptr = model.get_value_ptr(VAR_NAME)
+    assert ptr is model.get_value_ptr(VAR_NAME)
+    assert ptr.dtype == np.float64
+    assert ptr.shape == (model.get_grid_size(GRID_ID),)
+
+    dest = np.empty_like(ptr)
+    model.update()
+    assert_array_almost_equal(ptr, model.get_value(VAR_NAME, dest))
+
+    model.finalize()
+
+
+def test_get_value_ptr_writes_reach_the_model(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    ptr = model.get_value_ptr(VAR_NAME)
+    ptr.reshape((51, 51))[20:31, 20:31] = -1.0
+    model.update()
 
+    # A uniform patch keeps its temperature as it diffuses.
+    assert_array_almost_equal(ptr.reshape((51, 51))[21:30, 21:30], -1.0)
+    assert model.get_value_ptr(VAR_NAME) is ptr
 
-def test_get_value_at_indices():
+    model.finalize()
+
+
+@pytest.mark.parametrize("config_file", [CONFIG_FILE, "numpy.yaml"])
+def test_get_value_at_indices(shared_datadir, config_file):
     model = BmiHeatDiffusion()
-    dest = np.empty(3, dtype=float)
-    with pytest.raises(NotImplementedError):
-        model.get_value_at_indices(VAR_NAME, dest, [0, 2, 4])
+    model.initialize(shared_datadir / config_file)
+    model.update()
+
+    inds = np.array([0, 2, 4, 1300, 2600])
+    dest = np.empty(3 + 2, dtype=float)
+    model.get_value_at_indices(VAR_NAME, dest, inds)
+
+    value = np.empty(model.get_grid_size(GRID_ID), dtype=float)
+    model.get_value(VAR_NAME, value)
+    assert_array_almost_equal(dest, value[inds])
+
+    model.get_value_at_indices(VAR_NAME, dest, inds)
+    assert_array_almost_equal(dest, value[inds])
+
+    model.finalize()
 
 
 def test_value_size(shared_datadir):
@@ -60,3 +98,36 @@ def test_value_nbytes(shared_datadir):
     assert model.get_var_nbytes(VAR_NAME) == dest.nbytes
 
     model.finalize()
+
+
+def test_get_value_is_cached(shared_datadir, monkeypatch):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    transfers = []
+    get_temperature = model._model.get_temperature
+
+    def counting_get_temperature(out=None):
+        transfers.append(out)
+        return get_temperature(out=out)
+
+    monkeypatch.setattr(model._model, "get_temperature", counting_get_temperature)
+
+    dest0 = np.empty(model.get_grid_size(GRID_ID), dtype=float)
+    dest1 = np.empty_like(dest0)
+    model.get_value(VAR_NAME, dest0)
+    model.get_value(VAR_NAME, dest1)
+    assert len(transfers) == 0
+
+    model.update()
+    model.get_value(VAR_NAME, dest0)
+    model.get_value(VAR_NAME, dest1)
+    assert len(transfers) == 1
+    assert_array_almost_equal(dest0, dest1)
+
+    model.set_value(VAR_NAME, np.full_like(dest0, -1.0))
+    model.get_value(VAR_NAME, dest0)
+    assert len(transfers) == 1
+    assert_array_almost_equal(dest0, -1.0)
+
+    model.finalize()
@@ -0,0 +1,94 @@
+"""Test taking implicit steps in update_until."""
+
+import numpy as np
+import pytest
+
+from heat import BmiHeatDiffusion
+from heat.heat import HeatDiffusion
+from heat.implicit import CrankNicolson
+
+VAR_NAME = "plate_surface__temperature"
+
+
+def run(config_file, time):
+    model = BmiHeatDiffusion()
+    model.initialize(config_file)
+    model.update_until(time)
+    value = model.get_value(VAR_NAME, np.empty(model.get_grid_size(0)))
+    error = model.get_implicit_error()
+    ticks = model._model.ticks
+    model.finalize()
+    return value, error, ticks
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_implicit_matches_explicit(shared_datadir, config_file, make_config):
+    explicit, error, ticks = run(shared_datadir / config_file, 5.1)
+    assert np.isnan(error)
+
+    implicit, error, implicit_ticks = run(
+        make_config(shared_datadir / config_file, implicit={"step": 0.5}), 5.1
+    )
+    assert implicit_ticks == ticks
+    assert 0.0 < error < 1.0
+    assert np.abs(implicit - explicit).max() == pytest.approx(error)
+
+
+def test_implicit_error_is_a_bound(shared_datadir, make_config):
+    explicit, _, ticks = run(shared_datadir / "numpy.yaml", 5.25)
+    implicit, error, implicit_ticks = run(
+        make_config(shared_datadir / "numpy.yaml", implicit={"step": 0.5}), 5.25
+    )
+    assert implicit_ticks == ticks
+    assert np.abs(implicit - explicit).max() <= error
+
+
+def test_implicit_error_before_update(shared_datadir, make_config):
+    model = BmiHeatDiffusion()
+    model.initialize(make_config(shared_datadir / "numpy.yaml", implicit={"step": 0.5}))
+    assert np.isnan(model.get_implicit_error())
+
+    model.update_until(0.1)
+    assert model.get_implicit_error() == 0.0
+
+    model.update_until(1.0)
+    assert model.get_implicit_error() > 0.0
+    model.reset()
+    assert np.isnan(model.get_implicit_error())
+
+    model.finalize()
+
+
+def test_factorization_is_cached():
+    model = HeatDiffusion()
+    model.setup()
+    solver = CrankNicolson(n_ticks=10)
+
+    solver.advance(model.temperature, model.plate_size, (25, 25), 0.1, 2)
+    lu = solver._lu
+    solver.advance(model.temperature, model.plate_size, (25, 25), 0.1, 2)
+    assert solver._lu is lu
+
+    solver.advance(model.temperature, model.plate_size, (25, 25), 0.2, 2)
+    assert solver._lu is not lu
+
+
+def test_implicit_errors(shared_datadir, make_config):
+    with pytest.raises(ValueError):
+        CrankNicolson(n_ticks=0)
+
+    model = BmiHeatDiffusion()
+    with pytest.raises(ValueError):
+        model.initialize(
+            make_config(
+                shared_datadir / "numpy.yaml",
+                implicit={"step": 0.5},
+                steady_state={"tolerance": 1e-3},
+            )
+        )
+
+    model = BmiHeatDiffusion()
+    model.initialize(make_config(shared_datadir / "numpy.yaml", implicit={"step": 0.5}))
+    with pytest.raises(ValueError):
+        model.setup_tiles([{"alpha": 0.5}])
+    model.finalize()
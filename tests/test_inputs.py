@@ -0,0 +1,143 @@
+"""Test the model parameters exposed as BMI input variables."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from heat import BmiHeatDiffusion
+from heat.bmi_heatdiffusion import MODULE_PATH
+
+SCALAR_GRID_ID = 1
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_input_var_functions(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+
+    for name in model.get_input_var_names():
+        assert model.get_var_grid(name) == SCALAR_GRID_ID
+        assert model.get_var_type(name) == "float64"
+        assert model.get_var_itemsize(name) == 8
+        assert model.get_var_nbytes(name) == 8
+        assert model.get_var_location(name) == "node"
+    assert model.get_var_units("alpha") == "1"
+    assert model.get_var_units("top-temp") == "C"
+
+    assert model.get_grid_type(SCALAR_GRID_ID) == "scalar"
+    assert model.get_grid_rank(SCALAR_GRID_ID) == 0
+    assert model.get_grid_size(SCALAR_GRID_ID) == 1
+
+    model.finalize()
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_get_input_values(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+
+    expected = {
+        "alpha": 10.0,
+        "initial-plate-temp": 87.0,
+        "top-temp": 81.0,
+        "bottom-temp": 41.0,
+        "left-temp": 3.0,
+        "right-temp": 100.0,
+    }
+    for name, value in expected.items():
+        assert model.get_value(name, np.empty(1)) == pytest.approx(value)
+        assert model.get_value_ptr(name) == pytest.approx(value)
+
+    model.finalize()
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_set_input_values(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+
+    model.set_value("top-temp", np.array([20.0]))
+    model.set_value_at_indices("bottom-temp", np.array([0]), np.array([60.0]))
+    model.get_value_ptr("alpha")[:] = 2.0
+    model.update()
+
+    assert model.get_value("top-temp", np.empty(1)) == pytest.approx(20.0)
+    assert model._model.report("top-temp") == pytest.approx(20.0)
+    assert model._model.report("bottom-temp") == pytest.approx(60.0)
+    assert model._model.report("alpha") == pytest.approx(2.0)
+
+    shape = np.empty(2, dtype=int)
+    model.get_grid_shape(0, shape)
+    temperature = model.get_value_ptr("plate_surface__temperature").reshape(shape)
+    assert temperature[shape[0] // 2 - 15, shape[1] // 2] == pytest.approx(20.0)
+    assert temperature[shape[0] // 2 + 15, shape[1] // 2] == pytest.approx(60.0)
+
+    model.finalize()
+
+
+def test_input_changes_are_batched(shared_datadir, monkeypatch):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    calls = []
+    set_parameters = model._model.set_parameters
+
+    def counting_set_parameters(parameters):
+        calls.append(dict(parameters))
+        set_parameters(parameters)
+
+    monkeypatch.setattr(model._model, "set_parameters", counting_set_parameters)
+
+    model.update()
+    assert calls == []
+
+    for name in ("top-temp", "bottom-temp", "left-temp", "right-temp"):
+        model.set_value(name, np.array([50.0]))
+    model.set_value("right-temp", np.array([100.0]))
+    assert calls == []
+    assert model.get_attribute("top-temp") == pytest.approx(50.0)
+
+    model.update()
+    assert calls == [{"top-temp": 50.0, "bottom-temp": 50.0, "left-temp": 50.0}]
+
+    model.update_until(model.get_current_time() + 1.0)
+    assert len(calls) == 1
+
+    model.finalize()
+
+
+def test_reset_updates_inputs(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+    ptr = model.get_value_ptr("left-temp")
+
+    model.reset({"left-temp": 10.0})
+    assert_array_equal(ptr, 10.0)
+
+    model.finalize()
+
+
+def test_defaults_come_from_the_model_interface(shared_datadir, tmp_path, make_config):
+    with open(MODULE_PATH / "HeatDiffusion.nlogo") as fp:
+        source = fp.read()
+    model_file = tmp_path / "HeatDiffusion.nlogo"
+    with open(model_file, "w") as fp:
+        fp.write(
+            source.replace(
+                "top-temp\ntop-temp\n1.0\n100.0\n81.0",
+                "top-temp\ntop-temp\n1.0\n100.0\n55.0",
+            )
+        )
+
+    model = BmiHeatDiffusion()
+    model.initialize(
+        make_config(shared_datadir / "numpy.yaml", model_name=str(model_file))
+    )
+    assert_array_equal(model.get_value_ptr("top-temp"), 55.0)
+    assert model.get_attribute("top-temp") == 55.0
+
+    model.reset({"left-temp": 10.0})
+    assert_array_equal(model.get_value_ptr("top-temp"), 55.0)
+    assert model.get_attribute("top-temp") == 55.0
+
+    model.finalize()
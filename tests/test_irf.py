@@ -24,3 +24,17 @@ def test_irf(shared_datadir):
         assert_almost_equal(model.get_current_time(), (inc + 1) * model.get_time_step())
 
     model.finalize()
+
+
+def test_update_until(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / CONFIG_FILE)
+
+    model.update_until(2.0)
+    assert_almost_equal(model.get_current_time(), 2.0)
+    assert_almost_equal(model.get_attribute("ticks"), 20.0)
+
+    model.update_until(2.25)
+    assert_almost_equal(model.get_current_time(), 2.25)
+
+    model.finalize()
@@ -0,0 +1,100 @@
+"""Test the model metadata that is available without NetLogo."""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from heat import BmiHeatDiffusion
+from heat.bmi_heatdiffusion import MODULE_PATH
+from heat.metadata import parse_interface, read_interface
+
+VAR_NAME = "plate_surface__temperature"
+
+
+def test_read_interface():
+    interface = read_interface(MODULE_PATH / "HeatDiffusion.nlogo")
+
+    assert interface.extent == (-25, 25, -25, 25)
+    assert set(interface.sliders) == {
+        "alpha",
+        "initial-plate-temp",
+        "top-temp",
+        "bottom-temp",
+        "left-temp",
+        "right-temp",
+    }
+    assert interface.sliders["alpha"].value == pytest.approx(10.0)
+    assert interface.sliders["top-temp"].maximum == pytest.approx(100.0)
+    assert interface.choosers["material-type"].value == "aluminum"
+    assert interface.choosers["kernel"].choices == ["neighbors4", "diffuse4"]
+
+
+def test_slider_bounds_can_be_reporters():
+    text = (MODULE_PATH / "HeatDiffusion.nlogo").read_text(encoding="utf-8")
+    text = text.replace(
+        "alpha\nalpha\n0.0010\n10.0\n", "alpha\nalpha\n0.0010\nmax-pxcor\n"
+    )
+
+    slider = parse_interface(text).sliders["alpha"]
+    assert slider.maximum == "max-pxcor"
+    assert slider.value == pytest.approx(10.0)
+
+
+def test_read_interface_is_cached():
+    path = MODULE_PATH / "HeatDiffusion.nlogo"
+    assert read_interface(path) is read_interface(str(path))
+
+
+def test_parse_interface_needs_a_graphics_window():
+    with pytest.raises(ValueError):
+        parse_interface("to setup\nend\n")
+    with pytest.raises(ValueError):
+        parse_interface("to setup\nend\n@#$#@#$#@\nBUTTON\n0\n0\n1\n1\n")
+
+
+def test_metadata_before_initialize():
+    model = BmiHeatDiffusion()
+
+    assert model.get_var_type(VAR_NAME) == "float64"
+    assert model.get_var_nbytes(VAR_NAME) == 20808
+    assert model.get_var_grid("top-temp") == 1
+    assert_array_equal(model.get_grid_shape(0, np.empty(2, dtype=int)), (51, 51))
+    assert_array_equal(model.get_grid_origin(0, np.empty(2)), (-25.0, -25.0))
+    assert model.get_value("top-temp", np.empty(1)) == pytest.approx(81.0)
+    assert model._model is None
+
+
+def test_metadata_matches_initialized_model(shared_datadir):
+    model = BmiHeatDiffusion()
+    names = model.get_input_var_names() + model.get_output_var_names()
+    before = {name: model._var[name] for name in names}
+    grids = dict(model._grid)
+
+    model.initialize(shared_datadir / "numpy.yaml")
+    assert {name: model._var[name] for name in names} == before
+    assert model._grid == grids
+
+    model.finalize()
+
+
+def test_import_defers_netlogo():
+    modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys, heat; heat.BmiHeatDiffusion().get_var_nbytes"
+                "('plate_surface__temperature'); print(' '.join(sys.modules))"
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+
+    assert "pynetlogo" not in modules
+    assert "jpype" not in modules
+    assert "pandas" not in modules
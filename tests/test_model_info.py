@@ -15,25 +15,42 @@ def test_input_item_count():
     model = BmiHeatDiffusion()
 
     count = model.get_input_item_count()
-    assert count == 0
+    assert count == 6
 
 
 def test_input_var_names():
     model = BmiHeatDiffusion()
 
     names = model.get_input_var_names()
-    assert names == ()
+    assert names == (
+        "alpha",
+        "initial-plate-temp",
+        "top-temp",
+        "bottom-temp",
+        "left-temp",
+        "right-temp",
+    )
 
 
 def test_output_item_count():
     model = BmiHeatDiffusion()
 
     count = model.get_output_item_count()
-    assert count == 1
+    assert count == 9
 
 
 def test_output_var_names():
     model = BmiHeatDiffusion()
 
     names = model.get_output_var_names()
-    assert names == ("plate_surface__temperature",)
+    assert names == (
+        "plate_surface__temperature",
+        "plate_region_surface__temperature",
+        "plate_surface__mean_of_temperature",
+        "plate_surface__min_of_temperature",
+        "plate_surface__max_of_temperature",
+        "plate_top_edge__heat_inflow_rate",
+        "plate_bottom_edge__heat_inflow_rate",
+        "plate_left_edge__heat_inflow_rate",
+        "plate_right_edge__heat_inflow_rate",
+    )
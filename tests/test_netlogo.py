@@ -0,0 +1,120 @@
+"""Test transfers between NetLogo and NumPy."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from heat.bmi_heatdiffusion import MODULE_PATH
+from heat.heat import DEFAULT_PARAMETERS, HeatDiffusion
+from heat.netlogo import NetLogoHeatDiffusion, netlogo_list, netlogo_literal
+
+NETLOGO_HOME = "/opt/netlogo-6.1.1"
+MODEL_PATH = MODULE_PATH / "HeatDiffusion.nlogo"
+
+
+def has_jvm():
+    try:
+        import jpype
+    except ImportError:
+        return False
+    try:
+        jpype.getDefaultJVMPath()
+    except jpype.JVMNotFoundException:
+        return False
+    return True
+
+
+pytestmark = pytest.mark.skipif(not has_jvm(), reason="NetLogo needs a JVM")
+
+
+def test_netlogo_literal():
+    assert netlogo_literal(0.1) == "0.1"
+    assert netlogo_literal(3) == "3.0"
+    assert netlogo_literal('say "hi"') == r'"say \"hi\""'
+    assert netlogo_list([1, 2.5, -3]) == "[1 2.5 -3]"
+
+
+def test_get_temperature_matches_patch_report():
+    model = NetLogoHeatDiffusion(MODEL_PATH, netlogo_home=NETLOGO_HOME)
+    model.setup()
+    model.go(5)
+
+    expected = model._link.patch_report("temperature").values.reshape(-1)
+    assert_array_equal(model.get_temperature(), expected)
+
+    model.close()
+
+
+def test_set_temperature_matches_patch_report():
+    model = NetLogoHeatDiffusion(MODEL_PATH, netlogo_home=NETLOGO_HOME)
+    model.setup()
+
+    values = np.arange(model.shape[0] * model.shape[1], dtype=float) / 7.0
+    model.set_temperature(values)
+
+    assert_array_equal(
+        model._link.patch_report("temperature").values, values.reshape(model.shape)
+    )
+    assert_array_equal(model.get_temperature(), values)
+
+    model.close()
+
+
+def test_render_off_leaves_temperature_unchanged():
+    rendered = NetLogoHeatDiffusion(MODEL_PATH, netlogo_home=NETLOGO_HOME)
+    headless = NetLogoHeatDiffusion(MODEL_PATH, netlogo_home=NETLOGO_HOME, render=False)
+    for model in (rendered, headless):
+        model.setup()
+        model.go(10)
+
+    assert_array_equal(headless.get_temperature(), rendered.get_temperature())
+    assert headless.report("count patches with [pcolor != black]") == 0
+    assert headless.report('count patches with [plabel != ""]') == 0
+
+    rendered.close()
+    headless.close()
+
+
+def test_diffuse4_kernel_matches_neighbors4():
+    expected = NetLogoHeatDiffusion(MODEL_PATH, netlogo_home=NETLOGO_HOME)
+    actual = NetLogoHeatDiffusion(
+        MODEL_PATH, netlogo_home=NETLOGO_HOME, kernel="diffuse4"
+    )
+    for model in (expected, actual):
+        model.setup()
+
+    for _ in range(5):
+        for model in (expected, actual):
+            model.go(10, fraction=0.5)
+        assert_allclose(
+            actual.get_temperature(), expected.get_temperature(), rtol=1e-12
+        )
+    assert actual.ticks == expected.ticks
+
+    expected.close()
+    actual.close()
+
+
+def test_unknown_kernel():
+    with pytest.raises(ValueError):
+        NetLogoHeatDiffusion(MODEL_PATH, netlogo_home=NETLOGO_HOME, kernel="diffuse8")
+
+
+def test_setup_tiles_matches_numpy_backend():
+    members = [
+        {**DEFAULT_PARAMETERS, "alpha": 0.5, "top-temp": 10.0},
+        {**DEFAULT_PARAMETERS, "alpha": 2.0, "left-temp": 90.0},
+        {**DEFAULT_PARAMETERS, "initial-plate-temp": 20.0},
+    ]
+    expected = HeatDiffusion()
+    actual = NetLogoHeatDiffusion(MODEL_PATH, netlogo_home=NETLOGO_HOME)
+    for model in (expected, actual):
+        model.setup()
+        model.setup_tiles((25, 25), 2, members)
+    assert_allclose(actual.get_temperature(), expected.get_temperature())
+
+    for model in (expected, actual):
+        model.go(10, fraction=0.5)
+    assert_allclose(actual.get_temperature(), expected.get_temperature(), rtol=1e-12)
+
+    actual.close()
@@ -0,0 +1,94 @@
+"""Test the output variable of temperatures on the plate region only."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from heat import BmiHeatDiffusion
+
+VAR_NAME = "plate_surface__temperature"
+PLATE_VAR_NAME = "plate_region_surface__temperature"
+PLATE_GRID_ID = 2
+
+
+def get_plate_region(model):
+    shape = model.get_grid_shape(0, np.empty(2, dtype=int))
+    temperature = model.get_value(VAR_NAME, np.empty(shape[0] * shape[1]))
+    size = int(model.get_attribute("plate-size"))
+    center = shape // 2
+    return temperature.reshape(shape)[
+        center[0] - size : center[0] + size + 1, center[1] - size : center[1] + size + 1
+    ]
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_plate_grid(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+    size = int(model.get_attribute("plate-size"))
+
+    assert model.get_var_grid(PLATE_VAR_NAME) == PLATE_GRID_ID
+    assert model.get_var_units(PLATE_VAR_NAME) == "C"
+    assert model.get_var_location(PLATE_VAR_NAME) == "face"
+    assert model.get_grid_type(PLATE_GRID_ID) == "uniform_rectilinear"
+    assert model.get_grid_rank(PLATE_GRID_ID) == 2
+    assert_array_equal(
+        model.get_grid_shape(PLATE_GRID_ID, np.empty(2, dtype=int)),
+        (2 * size + 1, 2 * size + 1),
+    )
+    assert_array_equal(model.get_grid_spacing(PLATE_GRID_ID, np.empty(2)), 1.0)
+    assert_array_equal(model.get_grid_origin(PLATE_GRID_ID, np.empty(2)), -size)
+    assert model.get_var_nbytes(PLATE_VAR_NAME) == 8 * model.get_grid_size(
+        PLATE_GRID_ID
+    )
+
+    model.finalize()
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_plate_values_crop_the_field(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+    model.update_until(2.0)
+
+    plate = model.get_value(
+        PLATE_VAR_NAME, np.empty(model.get_grid_size(PLATE_GRID_ID))
+    )
+    assert_array_equal(plate, get_plate_region(model).reshape(-1))
+
+    model.finalize()
+
+
+def test_plate_values_skip_the_field(shared_datadir, monkeypatch):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+    model.update()
+    expected = model._model.get_plate_temperature()
+
+    def fail(*args, **kwds):
+        raise AssertionError("transferred the whole field")
+
+    monkeypatch.setattr(model._model, "get_temperature", fail)
+
+    plate = model.get_value(
+        PLATE_VAR_NAME, np.empty(model.get_grid_size(PLATE_GRID_ID))
+    )
+    assert_array_equal(plate, expected)
+
+    model.finalize()
+
+
+def test_plate_value_ptr_is_refreshed(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    ptr = model.get_value_ptr(PLATE_VAR_NAME)
+    before = ptr.copy()
+    model.update()
+    assert not np.array_equal(ptr, before)
+    assert_array_equal(ptr, model._model.get_plate_temperature())
+
+    with pytest.raises(ValueError):
+        model.set_value(PLATE_VAR_NAME, ptr)
+
+    model.finalize()
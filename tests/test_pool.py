@@ -0,0 +1,118 @@
+"""Test the pool of warm NetLogo workspaces."""
+
+import time
+
+import pytest
+
+from heat import BmiHeatDiffusion
+from heat.bmi_heatdiffusion import MODULE_PATH
+from heat.pool import WorkspacePool, workspace_pool
+
+CONFIG_FILE = "config.yaml"
+
+
+class Workspace:
+    def __init__(self):
+        self.is_closed = False
+
+    def close(self):
+        self.is_closed = True
+
+
+def test_checkout_reuses_workspace_by_key():
+    pool = WorkspacePool()
+
+    first = pool.checkout("a", Workspace)
+    pool.checkin("a", first)
+    assert len(pool) == 1
+
+    assert pool.checkout("b", Workspace) is not first
+    assert pool.checkout("a", Workspace) is first
+    assert len(pool) == 0
+
+
+def test_checkout_takes_most_recent_workspace():
+    pool = WorkspacePool()
+    first, second = Workspace(), Workspace()
+
+    pool.checkin("a", first)
+    pool.checkin("a", second)
+    assert pool.checkout("a", Workspace) is second
+    assert pool.checkout("a", Workspace) is first
+
+
+def test_checkin_closes_beyond_max_size():
+    pool = WorkspacePool(max_size=1)
+    first, second = Workspace(), Workspace()
+
+    pool.checkin("a", first)
+    pool.checkin("a", second)
+
+    assert first.is_closed
+    assert not second.is_closed
+    assert len(pool) == 1
+
+
+def test_idle_workspaces_are_evicted():
+    pool = WorkspacePool(max_idle=0.01)
+    workspace = Workspace()
+
+    pool.checkin("a", workspace)
+    time.sleep(0.02)
+
+    assert pool.checkout("a", Workspace) is not workspace
+    assert workspace.is_closed
+
+
+def test_disabled_pool():
+    pool = WorkspacePool()
+    pool.enabled = False
+    workspace = Workspace()
+
+    pool.checkin("a", workspace)
+    assert workspace.is_closed
+    assert len(pool) == 0
+
+
+def test_clear():
+    pool = WorkspacePool()
+    workspace = Workspace()
+
+    pool.checkin("a", workspace)
+    pool.clear()
+    assert workspace.is_closed
+    assert len(pool) == 0
+
+
+def test_initialize_reuses_workspace(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / CONFIG_FILE)
+    workspace = model._model
+    model.update()
+    model.finalize()
+
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / CONFIG_FILE)
+    assert model._model is workspace
+    assert model.get_current_time() == 0.0
+    model.finalize()
+
+    workspace_pool.clear()
+
+
+def test_failed_initialize_closes_workspace(shared_datadir):
+    class BrokenWorkspace(Workspace):
+        def resize(self, extent):
+            raise ValueError("cannot resize")
+
+    workspace = BrokenWorkspace()
+    workspace_pool.checkin(
+        ("/opt/netlogo-6.1.1", str(MODULE_PATH / "HeatDiffusion.nlogo")), workspace
+    )
+
+    model = BmiHeatDiffusion()
+    with pytest.raises(ValueError):
+        model.initialize(shared_datadir / CONFIG_FILE)
+    assert workspace.is_closed
+    assert model._pool_key is None
+    assert len(workspace_pool) == 0
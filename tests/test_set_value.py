@@ -31,7 +31,113 @@ def test_set_value(shared_datadir):
     model.finalize()
 
 
-def test_set_value_at_indices():
+@pytest.mark.parametrize("config_file", [CONFIG_FILE, "numpy.yaml"])
+def test_set_value_at_indices(shared_datadir, config_file):
     model = BmiHeatDiffusion()
-    with pytest.raises(NotImplementedError):
-        model.set_value_at_indices(VAR_NAME, [0, 2, 4], [-1, -1, -1])
+    model.initialize(shared_datadir / config_file)
+
+    z0 = np.empty(model.get_grid_size(GRID_ID), dtype=float)
+    model.get_value(VAR_NAME, z0)
+
+    inds = np.array([0, 2, 4, 1300])
+    model.set_value_at_indices(VAR_NAME, inds, np.array([-1.0, -2.0, -3.0, -4.0]))
+
+    new_z = np.empty_like(z0)
+    model.get_value(VAR_NAME, new_z)
+    z0[inds] = [-1.0, -2.0, -3.0, -4.0]
+    assert_array_almost_equal(new_z, z0)
+
+    dest = np.empty(len(inds), dtype=float)
+    model.update()
+    model.get_value_at_indices(VAR_NAME, dest, inds)
+    model.get_value(VAR_NAME, new_z)
+    assert_array_almost_equal(dest, new_z[inds])
+
+    model.finalize()
+
+
+@pytest.mark.parametrize("config_file", [CONFIG_FILE, "numpy.yaml"])
+def test_set_value_sends_changed_patches(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+    assert model.get_write_counts() == {
+        "unchanged": 0,
+        "indexed": 0,
+        "full": 0,
+        "patches": 0,
+    }
+
+    z = np.empty(model.get_grid_size(GRID_ID), dtype=float)
+    model.get_value(VAR_NAME, z)
+    model.set_value(VAR_NAME, z)
+    assert model.get_write_counts()["unchanged"] == 1
+
+    z[[3, 1300]] = [-1.0, -2.0]
+    model.set_value(VAR_NAME, z)
+    assert model.get_write_counts() == {
+        "unchanged": 1,
+        "indexed": 1,
+        "full": 0,
+        "patches": 2,
+    }
+
+    z[:] = -3.0
+    model.set_value(VAR_NAME, z)
+    assert model.get_write_counts()["full"] == 1
+    assert model.get_write_counts()["patches"] == 2 + z.size
+
+    model.update()
+    model.set_value(VAR_NAME, z)
+    assert model.get_write_counts()["full"] == 2
+
+    new_z = np.empty_like(z)
+    model.get_value(VAR_NAME, new_z)
+    assert_array_almost_equal(new_z, z)
+
+    model.finalize()
+
+
+def test_set_value_through_ptr_sends_changed_patches(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    z = model.get_value_ptr(VAR_NAME)
+    z[:10] = -1.0
+    model.update()
+    assert model.get_write_counts() == {
+        "unchanged": 0,
+        "indexed": 1,
+        "full": 0,
+        "patches": 10,
+    }
+
+    model.update()
+    assert model.get_write_counts()["indexed"] == 1
+
+    model.finalize()
+
+
+def test_set_value_sends_pending_ptr_writes(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    z0 = model.get_value(VAR_NAME, np.empty(model.get_grid_size(GRID_ID)))
+    ptr = model.get_value_ptr(VAR_NAME)
+    ptr[0] = 999.0
+    src = ptr.copy()
+    src[1] = 555.0
+    model.set_value(VAR_NAME, src)
+    assert model.get_write_counts()["indexed"] == 1
+    assert_array_almost_equal(model._model.get_temperature(), src)
+
+    ptr[0] = -1.0
+    model.set_value(VAR_NAME, src)
+    assert model.get_write_counts()["unchanged"] == 1
+    assert ptr[0] == 999.0
+    model.update()
+    assert model.get_write_counts()["indexed"] == 1
+
+    model.set_value(VAR_NAME, z0)
+    assert_array_almost_equal(model._model.get_temperature(), z0)
+
+    model.finalize()
@@ -0,0 +1,134 @@
+"""Test publishing the temperature field in shared memory."""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from heat import BmiHeatDiffusion
+from heat.shared import SharedFieldReader, SharedFieldWriter
+
+VAR_NAME = "plate_surface__temperature"
+
+
+def get_field(model):
+    shape = model.get_grid_shape(0, np.empty(2, dtype=int))
+    return model.get_value(VAR_NAME, np.empty(shape[0] * shape[1])).reshape(shape)
+
+
+def test_shared_memory_follows_model(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+    writer = model.add_shared_memory()
+
+    with SharedFieldReader(writer.name) as reader:
+        frame = reader.read()
+        assert frame.seq == 2
+        assert frame.time == pytest.approx(0.0)
+        assert_array_equal(frame.value, get_field(model))
+
+        model.update()
+        model.update_until(1.0)
+        frame = reader.read()
+        assert frame.seq == 6
+        assert frame.time == pytest.approx(1.0)
+        assert_array_equal(frame.value, get_field(model))
+        assert_array_equal(reader.value, frame.value)
+
+        assert reader.read().seq == frame.seq
+
+    model.finalize()
+    with pytest.raises(FileNotFoundError):
+        SharedFieldReader(writer.name)
+
+
+def test_writes_are_published(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+    writer = model.add_shared_memory()
+
+    with SharedFieldReader(writer.name) as reader:
+        field = get_field(model)
+        field[0, :3] = -1.0
+        model.set_value(VAR_NAME, field.reshape(-1))
+        frame = reader.read()
+        assert frame.seq == 4
+        assert_array_equal(frame.value, field)
+
+        model.set_value(VAR_NAME, field.reshape(-1))
+        assert reader.seq == 4
+
+        model.set_value_at_indices(VAR_NAME, np.array([5]), np.array([-2.0]))
+        field[0, 5] = -2.0
+        frame = reader.read()
+        assert frame.seq == 6
+        assert_array_equal(frame.value, field)
+
+        model.update_until(0.5)
+        model.reset()
+        frame = reader.read()
+        assert frame.time == pytest.approx(0.0)
+        assert_array_equal(frame.value, get_field(model))
+
+    model.finalize()
+
+
+def test_reader_in_another_process(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+    writer = model.add_shared_memory()
+    model.update_until(0.5)
+
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys; from heat.shared import SharedFieldReader;"
+                "reader = SharedFieldReader(sys.argv[1]); frame = reader.read();"
+                "print(frame.seq, frame.time, frame.value.sum()); reader.close()"
+            ),
+            writer.name,
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+
+    assert int(output[0]) == 4
+    assert float(output[1]) == pytest.approx(0.5)
+    assert float(output[2]) == pytest.approx(get_field(model).sum())
+
+    with SharedFieldReader(writer.name) as reader:
+        assert reader.seq == 4
+    model.finalize()
+
+
+def test_torn_and_unfinished_frames():
+    with (
+        SharedFieldWriter((2, 2)) as writer,
+        SharedFieldReader(writer.name) as reader,
+    ):
+        writer.write(0.1, np.zeros(4))
+        seq = reader.begin_read()
+        writer.write(0.2, np.ones(4))
+        assert reader.is_torn(seq)
+
+        seq = reader.begin_read()
+        assert not reader.is_torn(seq)
+        assert reader.time == pytest.approx(0.2)
+
+        writer._header["seq"] = seq + 1
+        with pytest.raises(TimeoutError):
+            reader.begin_read(timeout=0.01)
+        with pytest.raises(TimeoutError):
+            reader.read(timeout=0.01)
+
+
+def test_reader_rejects_other_blocks():
+    with SharedFieldWriter((2, 2)) as writer:
+        writer._header["magic"] = b"OTHER"
+        with pytest.raises(ValueError):
+            SharedFieldReader(writer.name)
@@ -0,0 +1,119 @@
+"""Test the instrumentation of BMI calls."""
+
+import json
+
+import numpy as np
+import pytest
+
+from heat import BmiHeatDiffusion
+from heat.stats import Instrumentation, InstrumentedLink
+
+VAR_NAME = "plate_surface__temperature"
+
+
+class Link:
+    def command(self, netlogo_command):
+        pass
+
+    def report(self, netlogo_reporter):
+        return np.zeros(10)
+
+    def kill_workspace(self):
+        pass
+
+
+def test_stats_disabled(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+    model.update()
+    assert model.get_stats() == {}
+    assert "update" not in vars(model)
+    model.finalize()
+
+
+def test_stats_count_calls(shared_datadir, make_config):
+    model = BmiHeatDiffusion()
+    model.initialize(make_config(shared_datadir / "numpy.yaml", instrumentation=True))
+    for _ in range(3):
+        model.update()
+    model.get_value(VAR_NAME, np.empty(model.get_grid_size(0)))
+
+    stats = model.get_stats()
+    assert stats["initialize"]["calls"] == 1
+    assert stats["update"]["calls"] == 3
+    assert stats["get_value"]["calls"] == 1
+    assert stats["get_grid_size"]["calls"] == 1
+    assert stats["update"]["total"] > 0.0
+    assert stats["update"]["p50"] <= stats["update"]["p99"]
+    assert stats["update"]["command"] == 0
+    model.finalize()
+
+
+def test_nested_calls_not_counted(shared_datadir, make_config):
+    model = BmiHeatDiffusion()
+    model.initialize(make_config(shared_datadir / "numpy.yaml", instrumentation=True))
+
+    model.get_grid_type(0)
+    model.get_grid_node_count(0)
+
+    stats = model.get_stats()
+    assert stats["get_grid_type"]["calls"] == 1
+    assert stats["get_grid_node_count"]["calls"] == 1
+    assert "get_grid_rank" not in stats
+    assert "get_grid_size" not in stats
+
+
+def test_initialize_again_counts_calls_once(shared_datadir, make_config):
+    config_file = make_config(shared_datadir / "numpy.yaml", instrumentation=True)
+    model = BmiHeatDiffusion()
+    model.initialize(config_file)
+    model.initialize(config_file)
+    model.update()
+    assert model.get_stats()["update"]["calls"] == 1
+
+    model.initialize(shared_datadir / "numpy.yaml")
+    assert "update" not in model.__dict__
+    model.finalize()
+
+
+def test_stats_json_file(shared_datadir, tmp_path, make_config):
+    model = BmiHeatDiffusion()
+    model.initialize(
+        make_config(
+            shared_datadir / "numpy.yaml", instrumentation={"json_file": "stats.json"}
+        )
+    )
+    model.update()
+    model.finalize()
+    assert "update" not in vars(model)
+
+    with open(tmp_path / "stats.json") as fp:
+        stats = json.load(fp)
+    assert stats["update"]["calls"] == 1
+
+
+def test_round_trips_charged_to_outer_call():
+    stats = Instrumentation()
+    link = InstrumentedLink(Link(), stats)
+
+    def update():
+        link.command("go")
+        link.report("ticks")
+
+    stats.timed("update", stats.timed("inner", update))()
+    link.command("setup")
+
+    counts = stats.as_dict()
+    assert counts["update"]["command"] == 1
+    assert counts["update"]["report"] == 1
+    assert counts["update"]["bytes_sent"] == len("go") + len("ticks")
+    assert counts["update"]["bytes_received"] == 80
+    assert "inner" not in counts
+    assert counts["<none>"]["command"] == 1
+
+
+def test_instrumented_link_passes_through():
+    link = InstrumentedLink(Link(), Instrumentation())
+    link.kill_workspace()
+    with pytest.raises(AttributeError):
+        link.load_model("HeatDiffusion.nlogo")
@@ -0,0 +1,85 @@
+"""Test stopping update_until once the plate is steady."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from heat import BmiHeatDiffusion
+
+VAR_NAME = "plate_surface__temperature"
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_update_until_stops_when_steady(shared_datadir, config_file, make_config):
+    model = BmiHeatDiffusion()
+    model.initialize(
+        make_config(
+            shared_datadir / config_file,
+            steady_state={"tolerance": 1e-3, "interval": 10},
+        )
+    )
+    assert not model.is_steady()
+    assert np.isnan(model.get_residual())
+
+    model.update_until(1000.0)
+    assert model.is_steady()
+    assert model.get_residual() < 1e-3
+
+    stop_time = model.get_current_time()
+    assert stop_time < 1000.0
+    n_ticks = round(stop_time / model.get_time_step())
+    assert n_ticks % 10 == 0
+
+    expected = BmiHeatDiffusion()
+    expected.initialize(shared_datadir / config_file)
+    expected.update_until(stop_time)
+    assert_array_equal(
+        model.get_value(VAR_NAME, np.empty(model.get_grid_size(0))),
+        expected.get_value(VAR_NAME, np.empty(expected.get_grid_size(0))),
+    )
+
+    expected.finalize()
+    model.finalize()
+
+
+def test_update_until_runs_to_time_unless_steady(shared_datadir, make_config):
+    model = BmiHeatDiffusion()
+    model.initialize(
+        make_config(
+            shared_datadir / "numpy.yaml",
+            steady_state={"tolerance": 0.0, "interval": 7},
+        )
+    )
+
+    model.update_until(2.25)
+    assert model.get_current_time() == pytest.approx(2.25)
+    assert model.get_residual() > 0.0
+    assert not model.is_steady()
+
+    model.finalize()
+
+
+def test_residual_is_reset(shared_datadir, make_config):
+    model = BmiHeatDiffusion()
+    model.initialize(
+        make_config(
+            shared_datadir / "numpy.yaml",
+            steady_state={"tolerance": 50.0, "interval": 10},
+        )
+    )
+
+    model.update_until(1.0)
+    assert model.is_steady()
+    model.reset()
+    assert not model.is_steady()
+
+    model.finalize()
+
+
+def test_steady_state_is_off_by_default(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+    model.update_until(5.0)
+    assert model.get_current_time() == pytest.approx(5.0)
+    assert not model.is_steady()
+    model.finalize()
@@ -0,0 +1,121 @@
+"""Test streaming snapshots of the temperature field to disk."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from heat import BmiHeatDiffusion
+from heat.heat import HeatDiffusion
+from heat.stream import SnapshotWriter, read_snapshots
+
+CONFIG_FILE = "numpy.yaml"
+
+
+def test_output_stream(shared_datadir, tmp_path):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / CONFIG_FILE)
+    writer = model.add_output_stream(tmp_path / "temperature.bin", every=3)
+
+    for _ in range(7):
+        model.update()
+    model.update_until(2.0)
+    model.finalize()
+
+    snapshots = read_snapshots(tmp_path / "temperature.bin")
+    assert writer.n_written == 7
+    assert writer.n_dropped == 0
+    assert_array_almost_equal(snapshots["time"], [0.0, 0.3, 0.6, 0.9, 1.2, 1.5, 1.8])
+    assert snapshots["value"].shape == (7, 51, 51)
+
+    expected = HeatDiffusion()
+    expected.setup()
+    for value in snapshots["value"]:
+        assert_array_almost_equal(value, expected.temperature)
+        expected.go(3)
+
+
+def test_fractional_steps_keep_the_cadence(shared_datadir, tmp_path):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / CONFIG_FILE)
+    model.add_output_stream(tmp_path / "temperature.bin", every=2)
+
+    model.update_until(0.25)
+    model.update_until(0.5)
+    model.update_until(0.85)
+    assert model.get_current_time() == pytest.approx(0.85)
+    model.finalize()
+
+    snapshots = read_snapshots(tmp_path / "temperature.bin")
+    assert_array_almost_equal(snapshots["time"], [0.0, 0.2, 0.4, 0.6, 0.8])
+
+    expected = HeatDiffusion()
+    expected.setup()
+    expected.go(2)
+    assert_array_almost_equal(snapshots["value"][1], expected.temperature)
+    expected.go(0, fraction=0.5)
+    expected.go(0, fraction=0.5)
+    expected.go(1)
+    assert_array_almost_equal(snapshots["value"][2], expected.temperature)
+
+
+def test_field_is_fetched_only_for_snapshots(shared_datadir, tmp_path, monkeypatch):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / CONFIG_FILE)
+    writer = model.add_output_stream(tmp_path / "temperature.bin", every=4)
+
+    calls = []
+    get_temperature = model._model.get_temperature
+
+    def counting_get_temperature(*args, **kwds):
+        calls.append(model._model.ticks)
+        return get_temperature(*args, **kwds)
+
+    monkeypatch.setattr(model._model, "get_temperature", counting_get_temperature)
+    for _ in range(9):
+        model.update()
+    assert calls == [4.0, 8.0]
+
+    model.update_until(2.0)
+    assert calls == [4.0, 8.0, 12.0, 16.0, 20.0]
+    model.finalize()
+    assert writer.n_written == 6
+
+
+def test_drop_when_full(tmp_path):
+    writer = SnapshotWriter(
+        tmp_path / "snapshots.bin", (4,), n_buffers=1, on_full="drop"
+    )
+    n_queued = sum(writer.write(float(time), np.full(4, time)) for time in range(100))
+    writer.close()
+
+    snapshots = read_snapshots(tmp_path / "snapshots.bin")
+    assert n_queued == writer.n_written == len(snapshots)
+    assert writer.n_dropped == 100 - n_queued
+    assert_array_equal(snapshots["value"][:, 0], snapshots["time"])
+
+
+def test_failed_writes_are_not_counted(tmp_path):
+    class FullDisk:
+        closed = False
+
+        def write(self, data):
+            raise OSError("no space left on device")
+
+        def flush(self):
+            pass
+
+        def close(self):
+            self.closed = True
+
+    writer = SnapshotWriter(tmp_path / "snapshots.bin", (4,))
+    writer._file.close()
+    writer._file = FullDisk()
+    writer.write(0.0, np.zeros(4))
+    with pytest.raises(OSError):
+        writer.close()
+    assert writer.n_written == 0
+
+
+def test_bad_on_full(tmp_path):
+    with pytest.raises(ValueError):
+        SnapshotWriter(tmp_path / "snapshots.bin", (4,), on_full="grow")
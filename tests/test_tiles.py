@@ -0,0 +1,118 @@
+"""Test running ensemble members as tiles of one world."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from heat import BmiHeatDiffusion
+from heat.ensemble import run_ensemble
+
+VAR_NAME = "plate_surface__temperature"
+MEMBERS = [
+    {"alpha": 0.5, "top-temp": 10.0},
+    {"alpha": 2.0, "left-temp": 90.0},
+    {"material-type": "iron", "initial-plate-temp": 20.0},
+]
+
+
+def run_member(config_file, parameters, time):
+    model = BmiHeatDiffusion()
+    model.initialize(config_file)
+    model.reset(parameters)
+    model.update_until(time)
+    value = model.get_value(VAR_NAME, np.empty(model.get_grid_size(0)))
+    model.finalize()
+    return value
+
+
+@pytest.mark.parametrize("config_file", ["config.yaml", "numpy.yaml"])
+def test_tiles_match_separate_models(shared_datadir, config_file):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / config_file)
+    layout = model.setup_tiles(MEMBERS)
+
+    assert layout.shape == (51, 51)
+    assert (layout.n_rows, layout.n_columns) == (2, 2)
+    assert model.get_current_time() == 0.0
+    assert_array_equal(model.get_grid_shape(0, np.empty(2, dtype=int)), (103, 103))
+
+    model.update_until(1.0)
+    values = model.get_tile_values()
+    assert values.shape == (3, 51 * 51)
+    for value, parameters in zip(values, MEMBERS):
+        assert_array_almost_equal(
+            value, run_member(shared_datadir / config_file, parameters, 1.0)
+        )
+
+    model.finalize()
+
+
+def test_tiles_advance_together(shared_datadir, monkeypatch):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+    model.setup_tiles(MEMBERS * 4, n_columns=5)
+
+    calls = []
+    go = model._model.go
+
+    def counting_go(*args, **kwds):
+        calls.append(args)
+        go(*args, **kwds)
+
+    monkeypatch.setattr(model._model, "go", counting_go)
+    model.update_until(1.0)
+    assert calls == [(10,)]
+
+    values = model.get_tile_values()
+    assert values.shape == (12, 51 * 51)
+    assert_array_equal(values[0], values[3])
+    assert not np.array_equal(values[0], values[1])
+
+    model.reset()
+    assert model.get_current_time() == 0.0
+    assert model.get_tile_values().shape == (12, 51 * 51)
+
+    model.finalize()
+
+
+def test_setup_tiles_errors(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    with pytest.raises(ValueError):
+        model.get_tile_values()
+    with pytest.raises(ValueError):
+        model.setup_tiles([])
+    with pytest.raises(ValueError):
+        model.setup_tiles([{"not-a-parameter": 1.0}])
+
+    model.get_value_ptr("plate_surface__temperature")
+    with pytest.raises(ValueError):
+        model.setup_tiles(MEMBERS)
+
+    model.finalize()
+
+
+def test_run_tiled_ensemble(shared_datadir):
+    sweep = {"alpha": [0.5, 2.0], "top-temp": [10.0, 90.0]}
+    tiled = run_ensemble(
+        shared_datadir / "numpy.yaml",
+        sweep,
+        times=[0.5, 1.0],
+        max_workers=2,
+        tiles_per_model=3,
+    )
+    separate = run_ensemble(
+        shared_datadir / "numpy.yaml", sweep, times=[0.5, 1.0], max_workers=2
+    )
+    assert tiled.shape == (4, 2, 2601)
+    assert_array_almost_equal(tiled, separate)
+
+    with pytest.raises(ValueError):
+        run_ensemble(
+            shared_datadir / "numpy.yaml",
+            sweep,
+            times=[1.0],
+            var_name="plate_surface__mean_of_temperature",
+            tiles_per_model=2,
+        )
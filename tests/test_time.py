@@ -1,6 +1,7 @@
 """Test BMI model time functions."""
 
 import numpy as np
+import pytest
 from numpy.testing import assert_almost_equal
 
 from heat import BmiHeatDiffusion
@@ -35,3 +36,23 @@ def test_time_units():
 
     units = model.get_time_units()
     assert units == "s"
+
+
+def test_update_until_current_time(shared_datadir):
+    model = BmiHeatDiffusion()
+    model.initialize(shared_datadir / "numpy.yaml")
+
+    for _ in range(3):
+        model.update()
+    model.update_until(0.3)
+    assert model._model.ticks == 3.0
+
+    model.update_until(0.7)
+    model.update_until(0.7)
+    assert model._model.ticks == 7.0
+    assert_almost_equal(model.get_current_time(), 0.7)
+
+    with pytest.raises(ValueError):
+        model.update_until(0.6)
+
+    model.finalize()
@@ -13,19 +13,19 @@ def test_var_functions(shared_datadir):
     id = model.get_var_grid(VAR_NAME)
     assert id == 0
 
-    dtype = model.get_var_type(id)
+    dtype = model.get_var_type(VAR_NAME)
     assert dtype == "float64"
 
-    units = model.get_var_units(id)
+    units = model.get_var_units(VAR_NAME)
     assert units == "C"
 
-    isize = model.get_var_itemsize(id)
+    isize = model.get_var_itemsize(VAR_NAME)
     assert isize == 8
 
-    nbytes = model.get_var_nbytes(id)
+    nbytes = model.get_var_nbytes(VAR_NAME)
     assert nbytes == 20808
 
-    loc = model.get_var_location(id)
+    loc = model.get_var_location(VAR_NAME)
     assert loc == "face"
 
     model.finalize()
@@ -0,0 +1,77 @@
+"""Test configuring the size of the world."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from heat import BmiHeatDiffusion
+from heat.heat import HeatDiffusion, legend_band, plate_size
+
+VAR_NAME = "plate_surface__temperature"
+GRID_ID = 0
+
+
+@pytest.mark.parametrize(
+    "max_pxcor,max_pycor", [(10, 10), (25, 25), (100, 60), (1000, 1000)]
+)
+def test_world_size(shared_datadir, max_pxcor, max_pycor, make_config):
+    model = BmiHeatDiffusion()
+    model.initialize(
+        make_config(
+            shared_datadir / "numpy.yaml", max_pxcor=max_pxcor, max_pycor=max_pycor
+        )
+    )
+
+    shape = (2 * max_pycor + 1, 2 * max_pxcor + 1)
+    assert_array_equal(model.get_grid_shape(GRID_ID, np.empty(2, dtype=int)), shape)
+    assert_array_equal(
+        model.get_grid_origin(GRID_ID, np.empty(2)), (-max_pycor, -max_pxcor)
+    )
+    assert model.get_grid_size(GRID_ID) == shape[0] * shape[1]
+    assert model.get_var_nbytes(VAR_NAME) == shape[0] * shape[1] * 8
+
+    size = model.get_attribute("plate-size")
+    assert size == round(0.6 * min(max_pxcor, max_pycor))
+
+    model.update()
+    temperature = model.get_value_ptr(VAR_NAME).reshape(shape)
+    assert temperature[max_pycor - size, max_pxcor] == pytest.approx(81.0)
+    assert temperature[max_pycor + size, max_pxcor] == pytest.approx(41.0)
+    assert temperature[max_pycor, max_pxcor] == pytest.approx(87.0)
+
+    model.finalize()
+
+
+def test_world_must_contain_origin(shared_datadir, make_config):
+    model = BmiHeatDiffusion()
+    with pytest.raises(ValueError, match="origin"):
+        model.initialize(
+            make_config(shared_datadir / "numpy.yaml", max_pxcor=-1, max_pycor=5)
+        )
+
+
+@pytest.mark.parametrize(
+    "extent,expected", [((-25, 25, -25, 25), 15), ((-50, 50, -20, 20), 12)]
+)
+def test_plate_size(extent, expected):
+    assert plate_size(extent) == expected
+
+
+def test_legend_grows_with_world():
+    model = HeatDiffusion(extent=(-40, 40, -60, 60))
+    model.setup()
+
+    band = legend_band(model.extent)
+    assert band == 5
+    legend = model.temperature[:, 5:8]
+    for y in range(10):
+        row = 60 - (y * band - 5 * band - 1)
+        assert_array_equal(legend[row - band + 1 : row + 1], y * 10.0)
+
+
+def test_legend_is_skipped_in_small_worlds():
+    assert legend_band((-10, 10, -11, 11)) == 0
+
+    model = HeatDiffusion(extent=(-10, 10, -11, 11))
+    model.setup()
+    assert not np.isin([10.0, 20.0, 30.0], model.temperature).any()